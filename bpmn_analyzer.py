@@ -8,7 +8,9 @@ import numpy as np
 from datetime import datetime
 import json
 import os
-from typing import Dict, List, Any, Tuple
+import sys
+from operator import itemgetter
+from typing import Dict, List, Any, Tuple, Union
 
 class BPMNAnalyzer:
     """
@@ -24,12 +26,13 @@ class BPMNAnalyzer:
         self.total_time = 0
         self.currencies = set()
         
-    def parse_bpmn_file(self, file_content: str) -> Dict[str, Any]:
+    def parse_bpmn_file(self, file_content: Union[str, bytes]) -> Dict[str, Any]:
         """
         Parse BPMN XML content and extract structured data.
         
         Args:
-            file_content: XML content as string
+            file_content: XML content as string, or raw bytes (decoded by the XML parser
+                using the document's declared encoding)
             
         Returns:
             Dictionary containing parsed BPMN data
@@ -92,8 +95,9 @@ class BPMNAnalyzer:
                     process_id = process.get('@id', 'Unknown')
                     process_name = process.get('@name', 'Unknown')
                     
-                    # Get swimlane name for this process
-                    swimlane_name = process_to_swimlane.get(process_id, process_name)
+                    # Get swimlane name for this process (interned like the other
+                    # categorical task fields, as every task in it carries the name)
+                    swimlane_name = sys.intern(process_to_swimlane.get(process_id, process_name))
                     
                     # Extract tasks from this process
                     process_tasks = []
@@ -182,7 +186,9 @@ class BPMNAnalyzer:
             cost_per_hour_str = camunda_properties.get('cost_per_hour', '0')
             cost_per_hour = float(cost_per_hour_str) if cost_per_hour_str and cost_per_hour_str.strip() else 0
             
-            currency = camunda_properties.get('currency', 'Unknown')
+            # Categorical values repeat across many tasks; interning keeps one
+            # string object per distinct value instead of one per task
+            currency = sys.intern(camunda_properties.get('currency', 'Unknown'))
             
             other_costs_str = camunda_properties.get('other_costs', '0')
             other_costs = float(other_costs_str) if other_costs_str and other_costs_str.strip() else 0
@@ -209,14 +215,14 @@ class BPMNAnalyzer:
                 'other_costs': other_costs,
                 'labor_cost': labor_cost,
                 'total_cost': total_task_cost,
-                'task_owner': camunda_properties.get('task_owner', 'Unknown'),
+                'task_owner': sys.intern(camunda_properties.get('task_owner', 'Unknown')),
                 'task_description': camunda_properties.get('task_description', ''),
-                'task_status': camunda_properties.get('task_status', 'Unknown'),
-                'doc_status': camunda_properties.get('doc_status', 'Unknown'),
+                'task_status': sys.intern(camunda_properties.get('task_status', 'Unknown')),
+                'doc_status': sys.intern(camunda_properties.get('doc_status', 'Unknown')),
                 'tools_used': camunda_properties.get('tools_used', ''),
                 'opportunities': camunda_properties.get('opportunities', ''),
                 'issues_text': camunda_properties.get('issues_text', ''),
-                'issues_priority': camunda_properties.get('issues_priority', ''),
+                'issues_priority': sys.intern(camunda_properties.get('issues_priority', '')),
                 'faq_q1': camunda_properties.get('faq_q1', ''),
                 'faq_a1': camunda_properties.get('faq_a1', ''),
                 'faq_q2': camunda_properties.get('faq_q2', ''),
@@ -372,11 +378,12 @@ class BPMNAnalyzer:
         if not tasks:
             return {}
         
-        # Calculate total costs and time
-        total_cost = sum(task.get('total_cost', 0) for task in tasks)
-        total_time_minutes = sum(task.get('time_minutes', 0) for task in tasks)
+        # Calculate total costs and time (_parse_task and _create_default_task
+        # always set these fields, so plain item lookups are safe)
+        total_cost = sum(map(itemgetter('total_cost'), tasks))
+        total_time_minutes = sum(map(itemgetter('time_minutes'), tasks))
         # Use the sum of individual task hours to ensure consistency with table display
-        total_time_hours = sum(task.get('time_hours', 0) for task in tasks)
+        total_time_hours = sum(map(itemgetter('time_hours'), tasks))
         
         # Debug: Print some task details to verify parsing
         print(f"DEBUG: Total tasks parsed: {len(tasks)}")
@@ -512,279 +519,289 @@ class BPMNAnalyzer:
         """
         try:
             with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                # Summary sheet
-                summary_data = analysis_data.get('summary', {})
-                summary_df = pd.DataFrame([summary_data])
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
-                
-                # Tasks sheet
-                tasks_df = pd.DataFrame(analysis_data.get('tasks', []))
-                if not tasks_df.empty:
-                    tasks_df.to_excel(writer, sheet_name='Tasks', index=False)
-                
-                # Swimlane analysis sheet
-                swimlane_data = analysis_data.get('swimlane_analysis', {})
-                if swimlane_data:
-                    swimlane_df = pd.DataFrame(swimlane_data).T.reset_index()
-                    # Ensure all required columns exist
-                    if 'total_time_minutes' in swimlane_df.columns:
-                        swimlane_df['Total Time (hrs)'] = swimlane_df['total_time_minutes'] / 60
-                    else:
-                        swimlane_df['Total Time (hrs)'] = 0
-                    
-                    # Rename columns to match expected structure
-                    column_mapping = {
-                        'index': 'Swimlane/Department',
-                        'task_count': 'Task Count',
-                        'total_cost': 'Total Cost',
-                        'total_time_minutes': 'Total Time (min)',
-                        'total_time_hours': 'Total Time (hrs)'
-                    }
-                    
-                    # Apply column mapping and add missing columns
-                    for old_col, new_col in column_mapping.items():
-                        if old_col in swimlane_df.columns:
-                            swimlane_df[new_col] = swimlane_df[old_col]
-                        else:
-                            swimlane_df[new_col] = 0
-                    
-                    # Ensure all expected columns exist
-                    expected_columns = ['Swimlane/Department', 'Task Count', 'Total Cost', 'Total Time (min)', 'Total Time (hrs)']
-                    for col in expected_columns:
-                        if col not in swimlane_df.columns:
-                            swimlane_df[col] = 0
-                    
-                    # Select only the expected columns in the right order
-                    swimlane_df = swimlane_df[expected_columns]
-                    swimlane_df.to_excel(writer, sheet_name='Swimlane Analysis', index=False)
-                
-                # Owner analysis sheet
-                owner_data = analysis_data.get('owner_analysis', {})
-                if owner_data:
-                    owner_df = pd.DataFrame(owner_data).T.reset_index()
-                    # Ensure all required columns exist
-                    if 'total_time_minutes' in owner_df.columns:
-                        owner_df['Total Time (hrs)'] = owner_df['total_time_minutes'] / 60
-                    else:
-                        owner_df['Total Time (hrs)'] = 0
-                    
-                    # Rename columns to match expected structure
-                    column_mapping = {
-                        'index': 'Owner',
-                        'task_count': 'Task Count',
-                        'total_cost': 'Total Cost',
-                        'total_time_minutes': 'Total Time (min)',
-                        'total_time_hours': 'Total Time (hrs)'
-                    }
-                    
-                    # Apply column mapping and add missing columns
-                    for old_col, new_col in column_mapping.items():
-                        if old_col in owner_df.columns:
-                            owner_df[new_col] = owner_df[old_col]
-                        else:
-                            owner_df[new_col] = 0
-                    
-                    # Ensure all expected columns exist
-                    expected_columns = ['Owner', 'Task Count', 'Total Cost', 'Total Time (min)', 'Total Time (hrs)']
-                    for col in expected_columns:
-                        if col not in owner_df.columns:
-                            owner_df[col] = 0
-                    
-                    # Select only the expected columns in the right order
-                    owner_df = owner_df[expected_columns]
-                    owner_df.to_excel(writer, sheet_name='Owner Analysis', index=False)
-                
-                # Status analysis sheet
-                status_data = analysis_data.get('status_analysis', {})
-                if status_data:
-                    status_df = pd.DataFrame(status_data).T.reset_index()
-                    # Ensure all required columns exist
-                    if 'total_time_minutes' in status_df.columns:
-                        status_df['Total Time (hrs)'] = status_df['total_time_minutes'] / 60
-                    else:
-                        status_df['Total Time (hrs)'] = 0
-                    
-                    # Rename columns to match expected structure
-                    column_mapping = {
-                        'index': 'Status',
-                        'task_count': 'Task Count',
-                        'total_cost': 'Total Cost',
-                        'total_time_minutes': 'Total Time (min)',
-                        'total_time_hours': 'Total Time (hrs)'
-                    }
-                    
-                    # Apply column mapping and add missing columns
-                    for old_col, new_col in column_mapping.items():
-                        if old_col in status_df.columns:
-                            status_df[new_col] = status_df[old_col]
-                        else:
-                            status_df[new_col] = 0
-                    
-                    # Ensure all expected columns exist
-                    expected_columns = ['Status', 'Task Count', 'Total Cost', 'Total Time (min)', 'Total Time (hrs)']
-                    for col in expected_columns:
-                        if col not in status_df.columns:
-                            status_df[col] = 0
-                    
-                    # Select only the expected columns in the right order
-                    status_df = status_df[expected_columns]
-                    status_df.to_excel(writer, sheet_name='Status Analysis', index=False)
-                
-                # Priority analysis sheet
-                priority_data = analysis_data.get('priority_analysis', {})
-                if priority_data:
-                    priority_df = pd.DataFrame(priority_data).T.reset_index()
-                    # Ensure all required columns exist
-                    if 'total_time_minutes' in priority_df.columns:
-                        priority_df['Total Time (hrs)'] = priority_df['total_time_minutes'] / 60
-                    else:
-                        priority_df['Total Time (hrs)'] = 0
-                    
-                    # Rename columns to match expected structure
-                    column_mapping = {
-                        'index': 'Priority',
-                        'task_count': 'Task Count',
-                        'total_cost': 'Total Cost',
-                        'total_time_minutes': 'Total Time (min)',
-                        'total_time_hours': 'Total Time (hrs)'
-                    }
-                    
-                    # Apply column mapping and add missing columns
-                    for old_col, new_col in column_mapping.items():
-                        if old_col in priority_df.columns:
-                            priority_df[new_col] = priority_df[old_col]
-                        else:
-                            priority_df[new_col] = 0
-                    
-                    # Ensure all expected columns exist
-                    expected_columns = ['Priority', 'Task Count', 'Total Cost', 'Total Time (min)', 'Total Time (hrs)']
-                    for col in expected_columns:
-                        if col not in priority_df.columns:
-                            priority_df[col] = 0
-                    
-                    # Select only the expected columns in the right order
-                    priority_df = priority_df[expected_columns]
-                    priority_df.to_excel(writer, sheet_name='Priority Analysis', index=False)
-                
-                # Documentation status analysis sheet
-                doc_status_data = analysis_data.get('doc_status_analysis', {})
-                if doc_status_data:
-                    doc_status_df = pd.DataFrame(doc_status_data).T.reset_index()
-                    # Ensure all required columns exist
-                    if 'total_time_minutes' in doc_status_df.columns:
-                        doc_status_df['Total Time (hrs)'] = doc_status_df['total_time_minutes'] / 60
-                    else:
-                        doc_status_df['Total Time (hrs)'] = 0
-                    
-                    # Rename columns to match expected structure
-                    column_mapping = {
-                        'index': 'Documentation Status',
-                        'task_count': 'Task Count',
-                        'total_cost': 'Total Cost',
-                        'total_time_minutes': 'Total Time (min)',
-                        'total_time_hours': 'Total Time (hrs)'
-                    }
-                    
-                    # Apply column mapping and add missing columns
-                    for old_col, new_col in column_mapping.items():
-                        if old_col in doc_status_df.columns:
-                            doc_status_df[new_col] = doc_status_df[old_col]
-                        else:
-                            doc_status_df[new_col] = 0
-                    
-                    # Ensure all expected columns exist
-                    expected_columns = ['Documentation Status', 'Task Count', 'Total Cost', 'Total Time (min)', 'Total Time (hrs)']
-                    for col in expected_columns:
-                        if col not in doc_status_df.columns:
-                            doc_status_df[col] = 0
-                    
-                    # Select only the expected columns in the right order
-                    doc_status_df = doc_status_df[expected_columns]
-                    doc_status_df.to_excel(writer, sheet_name='Documentation Status', index=False)
-                
-                # Tools analysis sheet
-                tools_data = analysis_data.get('tools_analysis', {})
-                if tools_data:
-                    tools_df = pd.DataFrame(tools_data).T.reset_index()
-                    # Ensure all required columns exist
-                    if 'total_time_minutes' in tools_df.columns:
-                        tools_df['Total Time (hrs)'] = tools_df['total_time_minutes'] / 60
-                    else:
-                        tools_df['Total Time (hrs)'] = 0
-                    
-                    # Rename columns to match expected structure
-                    column_mapping = {
-                        'index': 'Tool',
-                        'task_count': 'Task Count',
-                        'total_cost': 'Total Cost',
-                        'total_time_minutes': 'Total Time (min)',
-                        'total_time_hours': 'Total Time (hrs)'
-                    }
-                    
-                    # Apply column mapping and add missing columns
-                    for old_col, new_col in column_mapping.items():
-                        if old_col in tools_df.columns:
-                            tools_df[new_col] = tools_df[old_col]
-                        else:
-                            tools_df[new_col] = 0
-                    
-                    # Ensure all expected columns exist
-                    expected_columns = ['Tool', 'Task Count', 'Total Cost', 'Total Time (min)', 'Total Time (hrs)']
-                    for col in expected_columns:
-                        if col not in tools_df.columns:
-                            tools_df[col] = 0
-                    
-                    # Select only the expected columns in the right order
-                    tools_df = tools_df[expected_columns]
-                    tools_df.to_excel(writer, sheet_name='Tools Analysis', index=False)
-                
-                # Tool combinations sheet
-                tool_combinations_data = analysis_data.get('tool_combinations', {})
-                if tool_combinations_data:
-                    combo_df = pd.DataFrame(tool_combinations_data).T.reset_index()
-                    # Ensure all required columns exist
-                    if 'total_time_minutes' in combo_df.columns:
-                        combo_df['Total Time (hrs)'] = combo_df['total_time_minutes'] / 60
-                    else:
-                        combo_df['Total Time (hrs)'] = 0
-                    
-                    # Rename columns to match expected structure
-                    column_mapping = {
-                        'index': 'Tool Combination',
-                        'task_count': 'Task Count',
-                        'total_cost': 'Total Cost',
-                        'total_time_minutes': 'Total Time (min)',
-                        'total_time_hours': 'Total Time (hrs)'
-                    }
-                    
-                    # Apply column mapping and add missing columns
-                    for old_col, new_col in column_mapping.items():
-                        if old_col in combo_df.columns:
-                            combo_df[new_col] = combo_df[old_col]
-                        else:
-                            combo_df[new_col] = 0
-                    
-                    # Ensure all expected columns exist
-                    expected_columns = ['Tool Combination', 'Task Count', 'Total Cost', 'Total Time (min)', 'Total Time (hrs)']
-                    for col in expected_columns:
-                        if col not in combo_df.columns:
-                            combo_df[col] = 0
-                    
-                    # Select only the expected columns in the right order
-                    combo_df = combo_df[expected_columns]
-                    combo_df.to_excel(writer, sheet_name='Tool Combinations', index=False)
-                
-                # Quality control sheet
-                quality_data = analysis_data.get('quality_issues', [])
-                if quality_data:
-                    quality_df = pd.DataFrame(quality_data)
-                    quality_df.to_excel(writer, sheet_name='Quality Control', index=False)
+                self.write_excel_sheets(writer, analysis_data)
             
             return filename
             
         except Exception as e:
             st.error(f"Error generating Excel report: {str(e)}")
             return None
+    
+    def write_excel_sheets(self, writer: pd.ExcelWriter, analysis_data: Dict[str, Any]):
+        """
+        Write the detailed analysis sheets into an already open Excel writer.
+        
+        Args:
+            writer: Open pandas ExcelWriter (file path or in-memory buffer)
+            analysis_data: Analysis results
+        """
+        # Summary sheet
+        summary_data = analysis_data.get('summary', {})
+        summary_df = pd.DataFrame([summary_data])
+        summary_df.to_excel(writer, sheet_name='Summary', index=False)
+        
+        # Tasks sheet
+        tasks_df = pd.DataFrame(analysis_data.get('tasks', []))
+        if not tasks_df.empty:
+            tasks_df.to_excel(writer, sheet_name='Tasks', index=False)
+        
+        # Swimlane analysis sheet
+        swimlane_data = analysis_data.get('swimlane_analysis', {})
+        if swimlane_data:
+            swimlane_df = pd.DataFrame(swimlane_data).T.reset_index()
+            # Ensure all required columns exist
+            if 'total_time_minutes' in swimlane_df.columns:
+                swimlane_df['Total Time (hrs)'] = swimlane_df['total_time_minutes'] / 60
+            else:
+                swimlane_df['Total Time (hrs)'] = 0
+            
+            # Rename columns to match expected structure
+            column_mapping = {
+                'index': 'Swimlane/Department',
+                'task_count': 'Task Count',
+                'total_cost': 'Total Cost',
+                'total_time_minutes': 'Total Time (min)',
+                'total_time_hours': 'Total Time (hrs)'
+            }
+            
+            # Apply column mapping and add missing columns
+            for old_col, new_col in column_mapping.items():
+                if old_col in swimlane_df.columns:
+                    swimlane_df[new_col] = swimlane_df[old_col]
+                else:
+                    swimlane_df[new_col] = 0
+            
+            # Ensure all expected columns exist
+            expected_columns = ['Swimlane/Department', 'Task Count', 'Total Cost', 'Total Time (min)', 'Total Time (hrs)']
+            for col in expected_columns:
+                if col not in swimlane_df.columns:
+                    swimlane_df[col] = 0
+            
+            # Select only the expected columns in the right order
+            swimlane_df = swimlane_df[expected_columns]
+            swimlane_df.to_excel(writer, sheet_name='Swimlane Analysis', index=False)
+        
+        # Owner analysis sheet
+        owner_data = analysis_data.get('owner_analysis', {})
+        if owner_data:
+            owner_df = pd.DataFrame(owner_data).T.reset_index()
+            # Ensure all required columns exist
+            if 'total_time_minutes' in owner_df.columns:
+                owner_df['Total Time (hrs)'] = owner_df['total_time_minutes'] / 60
+            else:
+                owner_df['Total Time (hrs)'] = 0
+            
+            # Rename columns to match expected structure
+            column_mapping = {
+                'index': 'Owner',
+                'task_count': 'Task Count',
+                'total_cost': 'Total Cost',
+                'total_time_minutes': 'Total Time (min)',
+                'total_time_hours': 'Total Time (hrs)'
+            }
+            
+            # Apply column mapping and add missing columns
+            for old_col, new_col in column_mapping.items():
+                if old_col in owner_df.columns:
+                    owner_df[new_col] = owner_df[old_col]
+                else:
+                    owner_df[new_col] = 0
+            
+            # Ensure all expected columns exist
+            expected_columns = ['Owner', 'Task Count', 'Total Cost', 'Total Time (min)', 'Total Time (hrs)']
+            for col in expected_columns:
+                if col not in owner_df.columns:
+                    owner_df[col] = 0
+            
+            # Select only the expected columns in the right order
+            owner_df = owner_df[expected_columns]
+            owner_df.to_excel(writer, sheet_name='Owner Analysis', index=False)
+        
+        # Status analysis sheet
+        status_data = analysis_data.get('status_analysis', {})
+        if status_data:
+            status_df = pd.DataFrame(status_data).T.reset_index()
+            # Ensure all required columns exist
+            if 'total_time_minutes' in status_df.columns:
+                status_df['Total Time (hrs)'] = status_df['total_time_minutes'] / 60
+            else:
+                status_df['Total Time (hrs)'] = 0
+            
+            # Rename columns to match expected structure
+            column_mapping = {
+                'index': 'Status',
+                'task_count': 'Task Count',
+                'total_cost': 'Total Cost',
+                'total_time_minutes': 'Total Time (min)',
+                'total_time_hours': 'Total Time (hrs)'
+            }
+            
+            # Apply column mapping and add missing columns
+            for old_col, new_col in column_mapping.items():
+                if old_col in status_df.columns:
+                    status_df[new_col] = status_df[old_col]
+                else:
+                    status_df[new_col] = 0
+            
+            # Ensure all expected columns exist
+            expected_columns = ['Status', 'Task Count', 'Total Cost', 'Total Time (min)', 'Total Time (hrs)']
+            for col in expected_columns:
+                if col not in status_df.columns:
+                    status_df[col] = 0
+            
+            # Select only the expected columns in the right order
+            status_df = status_df[expected_columns]
+            status_df.to_excel(writer, sheet_name='Status Analysis', index=False)
+        
+        # Priority analysis sheet
+        priority_data = analysis_data.get('priority_analysis', {})
+        if priority_data:
+            priority_df = pd.DataFrame(priority_data).T.reset_index()
+            # Ensure all required columns exist
+            if 'total_time_minutes' in priority_df.columns:
+                priority_df['Total Time (hrs)'] = priority_df['total_time_minutes'] / 60
+            else:
+                priority_df['Total Time (hrs)'] = 0
+            
+            # Rename columns to match expected structure
+            column_mapping = {
+                'index': 'Priority',
+                'task_count': 'Task Count',
+                'total_cost': 'Total Cost',
+                'total_time_minutes': 'Total Time (min)',
+                'total_time_hours': 'Total Time (hrs)'
+            }
+            
+            # Apply column mapping and add missing columns
+            for old_col, new_col in column_mapping.items():
+                if old_col in priority_df.columns:
+                    priority_df[new_col] = priority_df[old_col]
+                else:
+                    priority_df[new_col] = 0
+            
+            # Ensure all expected columns exist
+            expected_columns = ['Priority', 'Task Count', 'Total Cost', 'Total Time (min)', 'Total Time (hrs)']
+            for col in expected_columns:
+                if col not in priority_df.columns:
+                    priority_df[col] = 0
+            
+            # Select only the expected columns in the right order
+            priority_df = priority_df[expected_columns]
+            priority_df.to_excel(writer, sheet_name='Priority Analysis', index=False)
+        
+        # Documentation status analysis sheet
+        doc_status_data = analysis_data.get('doc_status_analysis', {})
+        if doc_status_data:
+            doc_status_df = pd.DataFrame(doc_status_data).T.reset_index()
+            # Ensure all required columns exist
+            if 'total_time_minutes' in doc_status_df.columns:
+                doc_status_df['Total Time (hrs)'] = doc_status_df['total_time_minutes'] / 60
+            else:
+                doc_status_df['Total Time (hrs)'] = 0
+            
+            # Rename columns to match expected structure
+            column_mapping = {
+                'index': 'Documentation Status',
+                'task_count': 'Task Count',
+                'total_cost': 'Total Cost',
+                'total_time_minutes': 'Total Time (min)',
+                'total_time_hours': 'Total Time (hrs)'
+            }
+            
+            # Apply column mapping and add missing columns
+            for old_col, new_col in column_mapping.items():
+                if old_col in doc_status_df.columns:
+                    doc_status_df[new_col] = doc_status_df[old_col]
+                else:
+                    doc_status_df[new_col] = 0
+            
+            # Ensure all expected columns exist
+            expected_columns = ['Documentation Status', 'Task Count', 'Total Cost', 'Total Time (min)', 'Total Time (hrs)']
+            for col in expected_columns:
+                if col not in doc_status_df.columns:
+                    doc_status_df[col] = 0
+            
+            # Select only the expected columns in the right order
+            doc_status_df = doc_status_df[expected_columns]
+            doc_status_df.to_excel(writer, sheet_name='Documentation Status', index=False)
+        
+        # Tools analysis sheet
+        tools_data = analysis_data.get('tools_analysis', {})
+        if tools_data:
+            tools_df = pd.DataFrame(tools_data).T.reset_index()
+            # Ensure all required columns exist
+            if 'total_time_minutes' in tools_df.columns:
+                tools_df['Total Time (hrs)'] = tools_df['total_time_minutes'] / 60
+            else:
+                tools_df['Total Time (hrs)'] = 0
+            
+            # Rename columns to match expected structure
+            column_mapping = {
+                'index': 'Tool',
+                'task_count': 'Task Count',
+                'total_cost': 'Total Cost',
+                'total_time_minutes': 'Total Time (min)',
+                'total_time_hours': 'Total Time (hrs)'
+            }
+            
+            # Apply column mapping and add missing columns
+            for old_col, new_col in column_mapping.items():
+                if old_col in tools_df.columns:
+                    tools_df[new_col] = tools_df[old_col]
+                else:
+                    tools_df[new_col] = 0
+            
+            # Ensure all expected columns exist
+            expected_columns = ['Tool', 'Task Count', 'Total Cost', 'Total Time (min)', 'Total Time (hrs)']
+            for col in expected_columns:
+                if col not in tools_df.columns:
+                    tools_df[col] = 0
+            
+            # Select only the expected columns in the right order
+            tools_df = tools_df[expected_columns]
+            tools_df.to_excel(writer, sheet_name='Tools Analysis', index=False)
+        
+        # Tool combinations sheet
+        tool_combinations_data = analysis_data.get('tool_combinations', {})
+        if tool_combinations_data:
+            combo_df = pd.DataFrame(tool_combinations_data).T.reset_index()
+            # Ensure all required columns exist
+            if 'total_time_minutes' in combo_df.columns:
+                combo_df['Total Time (hrs)'] = combo_df['total_time_minutes'] / 60
+            else:
+                combo_df['Total Time (hrs)'] = 0
+            
+            # Rename columns to match expected structure
+            column_mapping = {
+                'index': 'Tool Combination',
+                'task_count': 'Task Count',
+                'total_cost': 'Total Cost',
+                'total_time_minutes': 'Total Time (min)',
+                'total_time_hours': 'Total Time (hrs)'
+            }
+            
+            # Apply column mapping and add missing columns
+            for old_col, new_col in column_mapping.items():
+                if old_col in combo_df.columns:
+                    combo_df[new_col] = combo_df[old_col]
+                else:
+                    combo_df[new_col] = 0
+            
+            # Ensure all expected columns exist
+            expected_columns = ['Tool Combination', 'Task Count', 'Total Cost', 'Total Time (min)', 'Total Time (hrs)']
+            for col in expected_columns:
+                if col not in combo_df.columns:
+                    combo_df[col] = 0
+            
+            # Select only the expected columns in the right order
+            combo_df = combo_df[expected_columns]
+            combo_df.to_excel(writer, sheet_name='Tool Combinations', index=False)
+        
+        # Quality control sheet
+        quality_data = analysis_data.get('quality_issues', [])
+        if quality_data:
+            quality_df = pd.DataFrame(quality_data)
+            quality_df.to_excel(writer, sheet_name='Quality Control', index=False)
 
 def setup_page():
     """Set up the page configuration and initial UI elements."""
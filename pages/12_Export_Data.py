@@ -4,17 +4,504 @@ This page is automatically generated from the main application tabs.
 """
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from bpmn_analyzer import categorize_opportunity, categorize_issue
-from utils.shared import setup_file_upload, get_combined_tasks, get_analysis_data, has_data, render_page_header, render_sidebar_header
-from bpmn_analyzer import BPMNAnalyzer
+from utils.shared import setup_file_upload, get_analyzer, get_combined_tasks, get_analysis_data, has_data, render_page_header, render_sidebar_header
 from datetime import datetime
 import json
+import re
 import zipfile
 import io
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Column layouts for the tabular (Excel/CSV) exports; rows are built as tuples in this order
+ISSUES_COLS = ('Type', 'Task Name', 'Department', 'Owner', 'Content', 'Priority', 'Current Cost', 'Current Time (hrs)', 'Status', 'Tools Used')
+FAQ_COLS = ('Task Name', 'Department', 'Owner', 'FAQ #', 'Question', 'Answer', 'Current Cost', 'Current Time (hrs)', 'Status', 'Tools Used')
+DOC_STATUS_COLS = ('Task Name', 'Department', 'Owner', 'Documentation Status', 'Documentation URL', 'Current Cost', 'Current Time (hrs)', 'Status', 'Tools Used')
+TOOLS_COLS = ('Task Name', 'Department', 'Owner', 'Tool Used', 'Original Tools Field', 'Current Cost', 'Current Time (hrs)', 'Status')
+
+# Export headers for the TOOLS_JSON_KEYS fields shown in the Tools Analysis sheet
+TOOLS_JSON_HEADERS = {
+    'task_name': 'Task Name',
+    'department': 'Department',
+    'owner': 'Owner',
+    'tool_used': 'Tool Used',
+    'original_tools_field': 'Original Tools Field',
+    'current_cost': 'Current Cost',
+    'current_time_hours': 'Current Time (hrs)',
+    'status': 'Status'
+}
+
+# Comma separator for the tools_used field, swallowing the whitespace around each entry
+_TOOL_SPLIT_RE = re.compile(r'\s*,\s*')
+
+# (question key, answer key, FAQ number) for the three FAQ slots on a task
+_FAQ_KEY_PAIRS = tuple((f'faq_q{i}', f'faq_a{i}', i) for i in (1, 2, 3))
+
+# Markdown report generator in bpmn_analyzer per export scope, and whether it also takes analysis_data
+MARKDOWN_GENERATORS = {
+    "Complete Analysis": ('generate_markdown_report', True),
+    "Tasks Only": ('generate_tasks_markdown', False),
+    "Summary Only": ('generate_summary_markdown', True),
+    "Issues & Opportunities Only": ('generate_issues_opportunities_markdown', False),
+    "FAQ Knowledge Only": ('generate_faq_markdown', False),
+    "Documentation Status Only": ('generate_documentation_status_markdown', False),
+    "Tools Analysis Only": ('generate_tools_analysis_markdown', False)
+}
+
+# Low-cardinality label columns (export headers and raw task keys) stored as categoricals before writing
+CATEGORY_COLS = (
+    'Department', 'Owner', 'Status', 'Documentation Status', 'Priority',
+    'swimlane', 'task_owner', 'task_status', 'doc_status', 'issues_priority'
+)
+
+
+def _categorize(df):
+    """Cast the CATEGORY_COLS present in an export frame to the category dtype."""
+    for col in CATEGORY_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+
+# JSON keys of the task fields shared by every export row, in _shared_values() order
+SHARED_JSON_KEYS = ('task_name', 'department', 'owner', 'current_cost', 'current_time_hours', 'status')
+
+
+def _shared_values(task):
+    """Look up the task fields shared by every export row, in SHARED_JSON_KEYS order."""
+    get = task.get
+    return (
+        get('name', 'Unknown'),
+        get('swimlane', 'Unknown'),
+        get('task_owner', 'Unknown'),
+        get('total_cost', 0),
+        get('time_hours', 0),
+        get('task_status', 'Unknown')
+    )
+
+
+def _project(task):
+    """Project the task fields shared by every JSON export row."""
+    return dict(zip(SHARED_JSON_KEYS, _shared_values(task)))
+
+
+def _issues_frame(combined_tasks):
+    """Build the Issues & Opportunities frame (ISSUES_COLS) from tuple rows."""
+    rows = []
+    append = rows.append
+    for task in combined_tasks:
+        # Shared task fields, looked up once per task
+        get = task.get
+        task_name, department, owner, cost, hours, status = _shared_values(task)
+        tools_used = get('tools_used', 'N/A')
+
+        # Add opportunities
+        opportunities = (get('opportunities') or '').strip()
+        if opportunities:
+            append((
+                'Opportunity',
+                task_name,
+                department,
+                owner,
+                opportunities,
+                None,
+                cost,
+                hours,
+                status,
+                tools_used
+            ))
+
+        # Add issues
+        issues_text = (get('issues_text') or '').strip()
+        if issues_text:
+            append((
+                'Issue/Risk',
+                task_name,
+                department,
+                owner,
+                issues_text,
+                get('issues_priority', 'Unknown'),
+                cost,
+                hours,
+                status,
+                tools_used
+            ))
+    return pd.DataFrame.from_records(rows, columns=ISSUES_COLS)
+
+
+def _has_issues(combined_tasks):
+    """Return True as soon as one task has opportunities or issues text."""
+    return any(
+        (task.get('opportunities') or '').strip() or (task.get('issues_text') or '').strip()
+        for task in combined_tasks
+    )
+
+
+def _faq_frame(combined_tasks):
+    """Build the FAQ Knowledge frame (FAQ_COLS), with a placeholder row for tasks without FAQs."""
+    rows = []
+    append = rows.append
+    for task in combined_tasks:
+        # Shared task fields, looked up once per task
+        get = task.get
+        task_name, department, owner, cost, hours, status = _shared_values(task)
+        tools_used = get('tools_used', 'N/A')
+        faqs_found = 0
+
+        for q_key, a_key, i in _FAQ_KEY_PAIRS:
+            question = (get(q_key) or '').strip()
+            answer = (get(a_key) or '').strip()
+
+            if question and answer:
+                faqs_found += 1
+                append((
+                    task_name,
+                    department,
+                    owner,
+                    i,
+                    question,
+                    answer,
+                    cost,
+                    hours,
+                    status,
+                    tools_used
+                ))
+
+        # If no FAQs found, add a placeholder row
+        if not faqs_found:
+            append((
+                task_name,
+                department,
+                owner,
+                'N/A',
+                'No FAQ captured',
+                'No FAQ captured',
+                cost,
+                hours,
+                status,
+                tools_used
+            ))
+    return pd.DataFrame.from_records(rows, columns=FAQ_COLS)
+
+
+def _doc_status_frame(combined_tasks):
+    """Build the Documentation Status frame (DOC_STATUS_COLS) from tuple rows."""
+    rows = []
+    append = rows.append
+    for task in combined_tasks:
+        # Shared task fields, looked up once per task
+        get = task.get
+        task_name, department, owner, cost, hours, status = _shared_values(task)
+        tools_used = get('tools_used', 'N/A')
+
+        append((
+            task_name,
+            department,
+            owner,
+            get('doc_status', 'Unknown'),
+            get('doc_url') or 'N/A',  # Missing/empty/NR/NO URL shows as N/A
+            cost,
+            hours,
+            status,
+            tools_used
+        ))
+    return pd.DataFrame.from_records(rows, columns=DOC_STATUS_COLS)
+
+
+def _tools_frame(combined_tasks):
+    """Build the Tools Analysis frame (TOOLS_COLS) from the same rows as the JSON export."""
+    rows = _iter_tools_rows(combined_tasks, map(_project, combined_tasks))
+    tools_df = pd.DataFrame.from_records(rows, columns=TOOLS_JSON_KEYS).rename(columns=TOOLS_JSON_HEADERS)
+    return tools_df[list(TOOLS_COLS)]
+
+
+# Focused export scopes shared by the Excel and CSV branches.
+# has_rows probes for output before the builder runs; the other scopes emit a row per task.
+EXPORT_SCHEMAS = {
+    "Issues & Opportunities Only": {
+        'label': 'Issues & Opportunities',
+        'sheet': 'Issues_Opportunities',
+        'file_prefix': 'bpmn_issues_opportunities',
+        'builder': _issues_frame,
+        'has_rows': _has_issues,
+        'empty_message': "⚠️ No issues or opportunities found in the data"
+    },
+    "FAQ Knowledge Only": {
+        'label': 'FAQ Knowledge',
+        'sheet': 'FAQ_Knowledge',
+        'file_prefix': 'bpmn_faq_knowledge',
+        'builder': _faq_frame,
+        'has_rows': bool,
+        'empty_message': "⚠️ No FAQ data found in the tasks"
+    },
+    "Documentation Status Only": {
+        'label': 'Documentation Status',
+        'sheet': 'Documentation_Status',
+        'file_prefix': 'bpmn_documentation_status',
+        'builder': _doc_status_frame,
+        'has_rows': bool,
+        'empty_message': "⚠️ No documentation status data found"
+    },
+    "Tools Analysis Only": {
+        'label': 'Tools Analysis',
+        'sheet': 'Tools_Analysis',
+        'file_prefix': 'bpmn_tools_analysis',
+        'builder': _tools_frame,
+        'has_rows': bool,
+        'empty_message': "⚠️ No tools data found in the tasks"
+    }
+}
+
+
+def dumps_json(obj, pretty=False):
+    """
+    Serialize obj to JSON bytes, using orjson when it is installed.
+    
+    Args:
+        obj: JSON-serializable object; unknown types are written with str()
+        pretty: Indent by two spaces; compact output is about half the size
+        
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, default=str).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def stream_rows_to_json(rows_iter, keys=None, pretty=False):
+    """
+    Encode rows one at a time into a JSON array without materializing the row list.
+    
+    Args:
+        rows_iter: Iterable of JSON-serializable row dicts, or of tuples when keys is given
+        keys: Optional field names zipped with each tuple row to form the JSON object
+        pretty: Indent each row and put it on its own line
+        
+    Returns:
+        JSON array bytes, or None when rows_iter yields no rows
+    """
+    open_sep, row_sep, close_sep = (b"[\n", b",\n", b"\n]") if pretty else (b"[", b",", b"]")
+    # Encoded rows and separators are joined once into the download payload
+    parts = []
+    append = parts.append
+    for row in rows_iter:
+        append(row_sep if parts else open_sep)
+        append(dumps_json(dict(zip(keys, row)) if keys else row, pretty))
+    if not parts:
+        return None
+    append(close_sep)
+    return b"".join(parts)
+
+
+def _projected_tasks(combined_tasks):
+    """
+    Return _project() for every task, reusing the projection across reruns.
+    
+    The projection is kept in session_state and keyed on the upload signature
+    (Streamlit file ids) saved by update_analysis_data, so it is rebuilt
+    whenever the files are reprocessed, even for a same-name re-upload.
+    
+    Args:
+        combined_tasks: List of task dictionaries
+        
+    Returns:
+        List of projected task dicts, in the same order as combined_tasks
+    """
+    upload_sig = st.session_state.get('_files_sig')
+    cached = st.session_state.get('_export_projection')
+    if cached is None or cached[0] != upload_sig:
+        cached = (upload_sig, [_project(task) for task in combined_tasks])
+        st.session_state['_export_projection'] = cached
+    return cached[1]
+
+
+# Field names for the tuple rows yielded by _iter_tools_rows
+TOOLS_JSON_KEYS = ('type', *SHARED_JSON_KEYS, 'tool_used', 'original_tools_field')
+
+
+def _iter_issues_rows(combined_tasks, projected):
+    """Yield Issues & Opportunities JSON rows."""
+    for task, base in zip(combined_tasks, projected):
+        get = task.get
+        opportunities = (get('opportunities') or '').strip()
+        issues_text = (get('issues_text') or '').strip()
+        if not (opportunities or issues_text):
+            continue
+
+        tools_used = get('tools_used', 'N/A')
+
+        # Add opportunities
+        if opportunities:
+            yield {'type': 'Opportunity', **base, 'content': opportunities, 'tools_used': tools_used}
+
+        # Add issues
+        if issues_text:
+            yield {
+                'type': 'Issue/Risk',
+                **base,
+                'content': issues_text,
+                'priority': get('issues_priority', 'Unknown'),
+                'tools_used': tools_used
+            }
+
+
+def _iter_faq_rows(combined_tasks, projected):
+    """Yield FAQ Knowledge JSON rows, with a placeholder for tasks without FAQs."""
+    for task, base in zip(combined_tasks, projected):
+        get = task.get
+        tools_used = get('tools_used', 'N/A')
+
+        # Check for FAQ fields
+        faqs_found = 0
+
+        for q_key, a_key, i in _FAQ_KEY_PAIRS:
+            question = (get(q_key) or '').strip()
+            answer = (get(a_key) or '').strip()
+
+            if question and answer:
+                faqs_found += 1
+                yield {
+                    'type': 'FAQ',
+                    **base,
+                    'faq_number': i,
+                    'question': question,
+                    'answer': answer,
+                    'tools_used': tools_used
+                }
+
+        # If no FAQs found, add a placeholder row
+        if not faqs_found:
+            yield {
+                'type': 'FAQ',
+                **base,
+                'faq_number': 'N/A',
+                'question': 'No FAQ captured',
+                'answer': 'No FAQ captured',
+                'tools_used': tools_used
+            }
+
+
+def _iter_doc_status_rows(combined_tasks, projected):
+    """Yield Documentation Status JSON rows."""
+    for task, base in zip(combined_tasks, projected):
+        get = task.get
+        yield {
+            'type': 'Documentation',
+            **base,
+            'documentation_status': get('doc_status', 'Unknown'),
+            'documentation_url': get('doc_url') or 'N/A',  # Missing/empty/NR/NO URL shows as N/A
+            'tools_used': get('tools_used', 'N/A')
+        }
+
+
+def _iter_tools_rows(combined_tasks, projected):
+    """Yield Tools Analysis JSON rows as tuples in TOOLS_JSON_KEYS order, one per listed tool."""
+    for task, base in zip(combined_tasks, projected):
+        # The projected fields are shared by every tool row of this task
+        head = ('Tool', *(base[key] for key in SHARED_JSON_KEYS))
+        tools = (task.get('tools_used') or '').strip()
+        if tools:
+            # Split tools and add each one
+            tool_list = [tool for tool in _TOOL_SPLIT_RE.split(tools) if tool]
+            for tool in tool_list:
+                yield (*head, tool, tools)
+        else:
+            # Task with no tools
+            yield (*head, 'No tools specified', 'N/A')
+
+
+# Focused JSON exports: row generator and tuple keys (None for dict rows)
+JSON_ROW_SCOPES = {
+    "Issues & Opportunities Only": (_iter_issues_rows, None),
+    "FAQ Knowledge Only": (_iter_faq_rows, None),
+    "Documentation Status Only": (_iter_doc_status_rows, None),
+    "Tools Analysis Only": (_iter_tools_rows, TOOLS_JSON_KEYS)
+}
+
+
+def _build_json_export(combined_tasks, scope, pretty):
+    """
+    Encode one focused JSON export on demand.
+    
+    Args:
+        combined_tasks: List of task dictionaries
+        scope: Key of JSON_ROW_SCOPES to export
+        pretty: Indent the JSON output
+        
+    Returns:
+        JSON bytes, or None when the scope has no rows
+    """
+    if not EXPORT_SCHEMAS[scope]['has_rows'](combined_tasks):
+        return None
+    iter_rows, keys = JSON_ROW_SCOPES[scope]
+    return stream_rows_to_json(iter_rows(combined_tasks, _projected_tasks(combined_tasks)), keys=keys, pretty=pretty)
+
+
+def _summary_metrics(combined_tasks, analysis_data):
+    """
+    Build the Summary Only metrics in a single pass over the tasks.
+    
+    Args:
+        combined_tasks: List of task dictionaries
+        analysis_data: Merged analysis data; totals come from its 'summary' section
+        
+    Returns:
+        Dict with total_tasks, total_cost, total_time_hours, departments_count and owners_count
+    """
+    departments = set()
+    owners = set()
+    for task in combined_tasks:
+        get = task.get
+        departments.add(get('swimlane', 'Unknown'))
+        owners.add(get('task_owner', 'Unknown'))
+    summary = analysis_data.get('summary', {})
+    total_time_minutes = summary.get('total_time_minutes', 0)
+    return {
+        'total_tasks': len(combined_tasks),
+        'total_cost': summary.get('total_cost', 0),
+        'total_time_hours': total_time_minutes / 60,
+        'departments_count': len(departments),
+        'owners_count': len(owners)
+    }
+
+
+def _excel_download(filename, report_label, sheets=(), analysis_data=None):
+    """
+    Write export sheets into one in-memory workbook and offer it for download.
+    
+    Args:
+        filename: File name offered to the browser
+        report_label: Report name shown in the success message
+        sheets: (sheet name, DataFrame) pairs to write; empty frames are skipped
+        analysis_data: When given, the analyzer's full set of analysis sheets is written first
+    """
+    excel_buffer = io.BytesIO()
+    with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
+        if analysis_data is not None:
+            get_analyzer().write_excel_sheets(writer, analysis_data)
+        for sheet_name, sheet_df in sheets:
+            if not sheet_df.empty:
+                sheet_df.to_excel(writer, sheet_name=sheet_name, index=False)
+    st.success(f"✅ {report_label} Excel report generated: {filename}")
+
+    # Provide download link
+    st.download_button(
+        label="📥 Download Excel Report",
+        data=excel_buffer.getvalue(),
+        file_name=filename,
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    )
+
+
 # Render sidebar header
 render_sidebar_header()
 
@@ -50,6 +537,9 @@ else:
             ["Complete Analysis", "Tasks Only", "Summary Only", "Issues & Opportunities Only", "FAQ Knowledge Only", "Documentation Status Only", "Tools Analysis Only"]
         )
 
+        # JSON is compact by default; indentation roughly doubles the download size
+        pretty_json = export_format == "JSON" and st.checkbox("Pretty-print JSON (larger)", value=False)
+
     with col2:
         st.write("**Export Options:**")
         st.write("• **Complete Analysis**: All data + charts")
@@ -58,424 +548,100 @@ else:
 
     # Export button
     if st.button("🚀 Generate Export", type="primary"):
+        # One timestamp per click keeps every file name from this export consistent
+        ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+
         if export_format == "Excel (.xlsx)":
             # Generate comprehensive Excel report
             try:
-                filename = f"bpmn_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+                filename = f"bpmn_analysis_{ts}.xlsx"
 
+                # Each arm checks its rows first; the workbook is only opened for non-empty exports
                 if export_scope == "Complete Analysis":
                     # Use the existing analysis_data that's already computed
-                    analyzer.generate_excel_report(analysis_data, filename)
-                    st.success(f"✅ Complete Excel report generated: {filename}")
+                    _excel_download(filename, "Complete", analysis_data=analysis_data)
                 elif export_scope == "Tasks Only":
                     # Export only tasks data
-                    tasks_df = pd.DataFrame(combined_tasks)
-                    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                        tasks_df.to_excel(writer, sheet_name='Tasks', index=False)
-                    st.success(f"✅ Tasks Excel report generated: {filename}")
-                elif export_scope == "Issues & Opportunities Only":
-                    # Export only issues and opportunities data
-                    issues_opportunities_data = []
-                    for task in combined_tasks:
-                        # Add opportunities
-                        opportunities = task.get('opportunities', '')
-                        if opportunities and opportunities.strip():
-                            issues_opportunities_data.append({
-                                'Type': 'Opportunity',
-                                'Task Name': task.get('name', 'Unknown'),
-                                'Department': task.get('swimlane', 'Unknown'),
-                                'Owner': task.get('task_owner', 'Unknown'),
-                                'Content': opportunities,
-                                'Current Cost': task.get('total_cost', 0),
-                                'Current Time (hrs)': task.get('time_hours', 0),
-                                'Status': task.get('task_status', 'Unknown'),
-                                'Tools Used': task.get('tools_used', 'N/A')
-                            })
-
-                        # Add issues
-                        issues_text = task.get('issues_text', '')
-                        if issues_text and issues_text.strip():
-                            issues_opportunities_data.append({
-                                'Type': 'Issue/Risk',
-                                'Task Name': task.get('name', 'Unknown'),
-                                'Department': task.get('swimlane', 'Unknown'),
-                                'Owner': task.get('task_owner', 'Unknown'),
-                                'Content': issues_text,
-                                'Priority': task.get('issues_priority', 'Unknown'),
-                                'Current Cost': task.get('total_cost', 0),
-                                'Current Time (hrs)': task.get('time_hours', 0),
-                                'Status': task.get('task_status', 'Unknown'),
-                                'Tools Used': task.get('tools_used', 'N/A')
-                            })
-
-                    if issues_opportunities_data:
-                        issues_df = pd.DataFrame(issues_opportunities_data)
-                        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                            issues_df.to_excel(writer, sheet_name='Issues_Opportunities', index=False)
-                        st.success(f"✅ Issues & Opportunities Excel report generated: {filename}")
-                    else:
-                        st.warning("⚠️ No issues or opportunities found in the data")
-
-                elif export_scope == "FAQ Knowledge Only":
-                    # Export only FAQ data
-                    faq_data = []
-                    for task in combined_tasks:
-                        # Check for FAQ fields
-                        faq_fields = ['faq_q1', 'faq_a1', 'faq_q2', 'faq_a2', 'faq_q3', 'faq_a3']
-                        task_has_faqs = False
-
-                        for i in range(1, 4):
-                            q_key = f'faq_q{i}'
-                            a_key = f'faq_a{i}'
-                            question = task.get(q_key, '')
-                            answer = task.get(a_key, '')
-
-                            if question and question.strip() and answer and answer.strip():
-                                task_has_faqs = True
-                                faq_data.append({
-                                    'Task Name': task.get('name', 'Unknown'),
-                                    'Department': task.get('swimlane', 'Unknown'),
-                                    'Owner': task.get('task_owner', 'Unknown'),
-                                    'FAQ #': i,
-                                    'Question': question.strip(),
-                                    'Answer': answer.strip(),
-                                    'Current Cost': task.get('total_cost', 0),
-                                    'Current Time (hrs)': task.get('time_hours', 0),
-                                    'Status': task.get('task_status', 'Unknown'),
-                                    'Tools Used': task.get('tools_used', 'N/A')
-                                })
-
-                        # If no FAQs found, add a placeholder row
-                        if not task_has_faqs:
-                            faq_data.append({
-                                'Task Name': task.get('name', 'Unknown'),
-                                'Department': task.get('swimlane', 'Unknown'),
-                                'Owner': task.get('task_owner', 'Unknown'),
-                                'FAQ #': 'N/A',
-                                'Question': 'No FAQ captured',
-                                'Answer': 'No FAQ captured',
-                                'Current Cost': task.get('total_cost', 0),
-                                'Current Time (hrs)': task.get('time_hours', 0),
-                                'Status': task.get('task_status', 'Unknown'),
-                                'Tools Used': task.get('tools_used', 'N/A')
-                            })
-
-                    if faq_data:
-                        faq_df = pd.DataFrame(faq_data)
-                        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                            faq_df.to_excel(writer, sheet_name='FAQ_Knowledge', index=False)
-                        st.success(f"✅ FAQ Knowledge Excel report generated: {filename}")
+                    _excel_download(filename, "Tasks", [('Tasks', _categorize(pd.DataFrame(combined_tasks)))])
+                elif export_scope in EXPORT_SCHEMAS:
+                    # Export one focused scope (issues, FAQ, documentation or tools)
+                    schema = EXPORT_SCHEMAS[export_scope]
+                    if not schema['has_rows'](combined_tasks):
+                        st.warning(schema['empty_message'])
                     else:
-                        st.warning("⚠️ No FAQ data found in the tasks")
-                elif export_scope == "Documentation Status Only":
-                    # Export only documentation status data
-                    doc_status_data = []
-                    for task in combined_tasks:
-                        doc_status_data.append({
-                            'Task Name': task.get('name', 'Unknown'),
-                            'Department': task.get('swimlane', 'Unknown'),
-                            'Owner': task.get('task_owner', 'Unknown'),
-                            'Documentation Status': task.get('doc_status', 'Unknown'),
-                            'Documentation URL': task.get('doc_url', '') or 'N/A',  # Empty/NR/NO URL shows as N/A
-                            'Current Cost': task.get('total_cost', 0),
-                            'Current Time (hrs)': task.get('time_hours', 0),
-                            'Status': task.get('task_status', 'Unknown'),
-                            'Tools Used': task.get('tools_used', 'N/A')
-                        })
-
-                    if doc_status_data:
-                        doc_df = pd.DataFrame(doc_status_data)
-                        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                            doc_df.to_excel(writer, sheet_name='Documentation_Status', index=False)
-                        st.success(f"✅ Documentation Status Excel report generated: {filename}")
-                    else:
-                        st.warning("⚠️ No documentation status data found")
-                elif export_scope == "Tools Analysis Only":
-                    # Export only tools analysis data
-                    tools_data = []
-                    for task in combined_tasks:
-                        tools = task.get('tools_used', '')
-                        if tools and tools.strip():
-                            # Split tools and add each one
-                            tool_list = [tool.strip() for tool in tools.split(',') if tool.strip()]
-                            for tool in tool_list:
-                                tools_data.append({
-                                    'Task Name': task.get('name', 'Unknown'),
-                                    'Department': task.get('swimlane', 'Unknown'),
-                                    'Owner': task.get('task_owner', 'Unknown'),
-                                    'Tool Used': tool,
-                                    'Original Tools Field': tools,
-                                    'Current Cost': task.get('total_cost', 0),
-                                    'Current Time (hrs)': task.get('time_hours', 0),
-                                    'Status': task.get('task_status', 'Unknown')
-                                })
-                        else:
-                            # Task with no tools
-                            tools_data.append({
-                                'Task Name': task.get('name', 'Unknown'),
-                                'Department': task.get('swimlane', 'Unknown'),
-                                'Owner': task.get('task_owner', 'Unknown'),
-                                'Tool Used': 'No tools specified',
-                                'Original Tools Field': 'N/A',
-                                'Current Cost': task.get('total_cost', 0),
-                                'Current Time (hrs)': task.get('time_hours', 0),
-                                'Status': task.get('task_status', 'Unknown')
-                            })
-
-                    if tools_data:
-                        tools_df = pd.DataFrame(tools_data)
-                        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                            tools_df.to_excel(writer, sheet_name='Tools_Analysis', index=False)
-                        st.success(f"✅ Tools Analysis Excel report generated: {filename}")
-                    else:
-                        st.warning("⚠️ No tools data found in the tasks")
+                        export_df = _categorize(schema['builder'](combined_tasks))
+                        _excel_download(filename, schema['label'], [(schema['sheet'], export_df)])
                 else:  # Summary Only
                     # Export summary metrics
+                    summary = _summary_metrics(combined_tasks, analysis_data)
                     summary_data = {
                         'Metric': ['Total Tasks', 'Total Cost', 'Total Time (hrs)', 'Departments', 'Task Owners'],
                         'Value': [
-                            len(combined_tasks),
-                            f"{analysis_data.get('total_costs', 0):.2f}",
-                            f"{analysis_data.get('total_time', 0) / 60:.2f}",
-                            len(set(task.get('swimlane', 'Unknown') for task in combined_tasks)),
-                            len(set(task.get('task_owner', 'Unknown') for task in combined_tasks))
+                            summary['total_tasks'],
+                            f"{summary['total_cost']:.2f}",
+                            f"{summary['total_time_hours']:.2f}",
+                            summary['departments_count'],
+                            summary['owners_count']
                         ]
                     }
-                    summary_df = pd.DataFrame(summary_data)
-                    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                        summary_df.to_excel(writer, sheet_name='Summary', index=False)
-                    st.success(f"✅ Summary Excel report generated: {filename}")
-
-                # Provide download link
-                with open(filename, "rb") as file:
-                    st.download_button(
-                        label="📥 Download Excel Report",
-                        data=file.read(),
-                        file_name=filename,
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                    )
+                    _excel_download(filename, "Summary", [('Summary', pd.DataFrame(summary_data))])
 
             except Exception as e:
                 st.error(f"❌ Error generating Excel report: {str(e)}")
-                st.error("Please check if the file is open in another application.")
 
         elif export_format == "CSV":
             # Export data as CSV
             try:
                 if export_scope == "Complete Analysis":
                     # Export all analysis data
-                    csv_files = {}
+                    csv_frames = {}
 
                     # Tasks CSV
-                    tasks_df = pd.DataFrame(combined_tasks)
-                    csv_files['tasks'] = tasks_df.to_csv(index=False)
+                    csv_frames['tasks'] = _categorize(pd.DataFrame(combined_tasks))
 
                     # Swimlane analysis CSV
                     if 'swimlane_analysis' in analysis_data:
-                        swimlane_df = pd.DataFrame(analysis_data['swimlane_analysis']).T.reset_index()
-                        csv_files['swimlane_analysis'] = swimlane_df.to_csv(index=False)
+                        csv_frames['swimlane_analysis'] = pd.DataFrame(analysis_data['swimlane_analysis']).T.reset_index()
 
                     # Owner analysis CSV
                     if 'owner_analysis' in analysis_data:
-                        owner_df = pd.DataFrame(analysis_data['owner_analysis']).T.reset_index()
-                        csv_files['owner_analysis'] = owner_df.to_csv(index=False)
-
-                    # Create zip file with multiple CSVs
-                    import zipfile
-                    import io
+                        csv_frames['owner_analysis'] = pd.DataFrame(analysis_data['owner_analysis']).T.reset_index()
 
+                    # Create zip file with multiple CSVs, streaming each frame into its archive member
                     zip_buffer = io.BytesIO()
-                    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                        for name, csv_data in csv_files.items():
-                            zip_file.writestr(f"{name}.csv", csv_data)
+                    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+                        for name, frame in csv_frames.items():
+                            with zip_file.open(f"{name}.csv", 'w', force_zip64=True) as member:
+                                with io.TextIOWrapper(member, encoding='utf-8', newline='') as csv_stream:
+                                    frame.to_csv(csv_stream, index=False)
 
-                    zip_buffer.seek(0)
                     st.download_button(
                         label="📥 Download All CSVs (ZIP)",
                         data=zip_buffer.getvalue(),
-                        file_name=f"bpmn_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip",
+                        file_name=f"bpmn_analysis_{ts}.zip",
                         mime="application/zip"
                     )
-                elif export_scope == "Issues & Opportunities Only":
-                    # Export only issues and opportunities data
-                    issues_opportunities_data = []
-                    for task in combined_tasks:
-                        # Add opportunities
-                        opportunities = task.get('opportunities', '')
-                        if opportunities and opportunities.strip():
-                            issues_opportunities_data.append({
-                                'Type': 'Opportunity',
-                                'Task Name': task.get('name', 'Unknown'),
-                                'Department': task.get('swimlane', 'Unknown'),
-                                'Owner': task.get('task_owner', 'Unknown'),
-                                'Content': opportunities,
-                                'Current Cost': task.get('total_cost', 0),
-                                'Current Time (hrs)': task.get('time_hours', 0),
-                                'Status': task.get('task_status', 'Unknown'),
-                                'Tools Used': task.get('tools_used', 'N/A')
-                            })
-
-                        # Add issues
-                        issues_text = task.get('issues_text', '')
-                        if issues_text and issues_text.strip():
-                            issues_opportunities_data.append({
-                                'Type': 'Issue/Risk',
-                                'Task Name': task.get('name', 'Unknown'),
-                                'Department': task.get('swimlane', 'Unknown'),
-                                'Owner': task.get('task_owner', 'Unknown'),
-                                'Content': issues_text,
-                                'Priority': task.get('issues_priority', 'Unknown'),
-                                'Current Cost': task.get('total_cost', 0),
-                                'Current Time (hrs)': task.get('time_hours', 0),
-                                'Status': task.get('task_status', 'Unknown'),
-                                'Tools Used': task.get('tools_used', 'N/A')
-                            })
-
-                    if issues_opportunities_data:
-                        issues_df = pd.DataFrame(issues_opportunities_data)
-                        csv_data = issues_df.to_csv(index=False)
-                        st.download_button(
-                            label="📥 Download Issues & Opportunities CSV",
-                            data=csv_data,
-                            file_name=f"bpmn_issues_opportunities_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                            mime="text/csv"
-                        )
+                elif export_scope in EXPORT_SCHEMAS:
+                    # Export one focused scope (issues, FAQ, documentation or tools)
+                    schema = EXPORT_SCHEMAS[export_scope]
+                    if not schema['has_rows'](combined_tasks):
+                        st.warning(schema['empty_message'])
                     else:
-                        st.warning("⚠️ No issues or opportunities found in the data")
-
-                elif export_scope == "FAQ Knowledge Only":
-                    # Export only FAQ data
-                    faq_data = []
-                    for task in combined_tasks:
-                        # Check for FAQ fields
-                        faq_fields = ['faq_q1', 'faq_a1', 'faq_q2', 'faq_a2', 'faq_q3', 'faq_a3']
-                        task_has_faqs = False
-
-                        for i in range(1, 4):
-                            q_key = f'faq_q{i}'
-                            a_key = f'faq_a{i}'
-                            question = task.get(q_key, '')
-                            answer = task.get(a_key, '')
-
-                            if question and question.strip() and answer and answer.strip():
-                                task_has_faqs = True
-                                faq_data.append({
-                                    'Task Name': task.get('name', 'Unknown'),
-                                    'Department': task.get('swimlane', 'Unknown'),
-                                    'Owner': task.get('task_owner', 'Unknown'),
-                                    'FAQ #': i,
-                                    'Question': question.strip(),
-                                    'Answer': answer.strip(),
-                                    'Current Cost': task.get('total_cost', 0),
-                                    'Current Time (hrs)': task.get('time_hours', 0),
-                                    'Status': task.get('task_status', 'Unknown'),
-                                    'Tools Used': task.get('tools_used', 'N/A')
-                                })
-
-                        # If no FAQs found, add a placeholder row
-                        if not task_has_faqs:
-                            faq_data.append({
-                                'Task Name': task.get('name', 'Unknown'),
-                                'Department': task.get('swimlane', 'Unknown'),
-                                'Owner': task.get('task_owner', 'Unknown'),
-                                'FAQ #': 'N/A',
-                                'Question': 'No FAQ captured',
-                                'Answer': 'No FAQ captured',
-                                'Current Cost': task.get('total_cost', 0),
-                                'Current Time (hrs)': task.get('time_hours', 0),
-                                'Status': task.get('task_status', 'Unknown'),
-                                'Tools Used': task.get('tools_used', 'N/A')
-                            })
-
-                    if faq_data:
-                        faq_df = pd.DataFrame(faq_data)
-                        csv_data = faq_df.to_csv(index=False)
+                        export_df = _categorize(schema['builder'](combined_tasks))
                         st.download_button(
-                            label="📥 Download FAQ Knowledge CSV",
-                            data=csv_data,
-                            file_name=f"bpmn_faq_knowledge_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                            label=f"📥 Download {schema['label']} CSV",
+                            data=export_df.to_csv(index=False),
+                            file_name=f"{schema['file_prefix']}_{ts}.csv",
                             mime="text/csv"
                         )
-                    else:
-                        st.warning("⚠️ No FAQ data found in the tasks")
-                elif export_scope == "Documentation Status Only":
-                    # Export only documentation status data
-                    doc_status_data = []
-                    for task in combined_tasks:
-                        doc_status_data.append({
-                            'Task Name': task.get('name', 'Unknown'),
-                            'Department': task.get('swimlane', 'Unknown'),
-                            'Owner': task.get('task_owner', 'Unknown'),
-                            'Documentation Status': task.get('doc_status', 'Unknown'),
-                            'Documentation URL': task.get('doc_url', '') or 'N/A',  # Empty/NR/NO URL shows as N/A
-                            'Current Cost': task.get('total_cost', 0),
-                            'Current Time (hrs)': task.get('time_hours', 0),
-                            'Status': task.get('task_status', 'Unknown'),
-                            'Tools Used': task.get('tools_used', 'N/A')
-                        })
-
-                    if doc_status_data:
-                        doc_df = pd.DataFrame(doc_status_data)
-                        csv_data = doc_df.to_csv(index=False)
-                        st.download_button(
-                            label="📥 Download Documentation Status CSV",
-                            data=csv_data,
-                            file_name=f"bpmn_documentation_status_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                            mime="text/csv"
-                        )
-                    else:
-                        st.warning("⚠️ No documentation status data found")
-                elif export_scope == "Tools Analysis Only":
-                    # Export only tools analysis data
-                    tools_data = []
-                    for task in combined_tasks:
-                        tools = task.get('tools_used', '')
-                        if tools and tools.strip():
-                            # Split tools and add each one
-                            tool_list = [tool.strip() for tool in tools.split(',') if tool.strip()]
-                            for tool in tool_list:
-                                tools_data.append({
-                                    'Task Name': task.get('name', 'Unknown'),
-                                    'Department': task.get('swimlane', 'Unknown'),
-                                    'Owner': task.get('task_owner', 'Unknown'),
-                                    'Tool Used': tool,
-                                    'Original Tools Field': tools,
-                                    'Current Cost': task.get('total_cost', 0),
-                                    'Current Time (hrs)': task.get('time_hours', 0),
-                                    'Status': task.get('task_status', 'Unknown')
-                                })
-                        else:
-                            # Task with no tools
-                            tools_data.append({
-                                'Task Name': task.get('name', 'Unknown'),
-                                'Department': task.get('swimlane', 'Unknown'),
-                                'Owner': task.get('task_owner', 'Unknown'),
-                                'Tool Used': 'No tools specified',
-                                'Original Tools Field': 'N/A',
-                                'Current Cost': task.get('total_cost', 0),
-                                'Current Time (hrs)': task.get('time_hours', 0),
-                                'Status': task.get('task_status', 'Unknown')
-                            })
-
-                    if tools_data:
-                        tools_df = pd.DataFrame(tools_data)
-                        csv_data = tools_df.to_csv(index=False)
-                        st.download_button(
-                            label="📥 Download Tools Analysis CSV",
-                            data=csv_data,
-                            file_name=f"bpmn_tools_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                            mime="text/csv"
-                        )
-                    else:
-                        st.warning("⚠️ No tools data found in the tasks")
                 else:
                     # Export single CSV
-                    tasks_df = pd.DataFrame(combined_tasks)
+                    tasks_df = _categorize(pd.DataFrame(combined_tasks))
                     csv_data = tasks_df.to_csv(index=False)
                     st.download_button(
                         label="📥 Download CSV",
                         data=csv_data,
-                        file_name=f"bpmn_tasks_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                        file_name=f"bpmn_tasks_{ts}.csv",
                         mime="text/csv"
                     )
 
@@ -485,25 +651,20 @@ else:
         elif export_format == "Markdown (.md)":
             # Export as comprehensive Markdown report
             try:
-                if export_scope == "Complete Analysis":
-                    markdown_content = generate_markdown_report(analysis_data, combined_tasks)
-                elif export_scope == "Tasks Only":
-                    markdown_content = generate_tasks_markdown(combined_tasks)
-                elif export_scope == "Issues & Opportunities Only":
-                    markdown_content = generate_issues_opportunities_markdown(combined_tasks)
-                elif export_scope == "FAQ Knowledge Only":
-                    markdown_content = generate_faq_markdown(combined_tasks)
-                elif export_scope == "Documentation Status Only":
-                    markdown_content = generate_documentation_status_markdown(combined_tasks)
-                elif export_scope == "Tools Analysis Only":
-                    markdown_content = generate_tools_analysis_markdown(combined_tasks)
-                else:  # Summary Only
-                    markdown_content = generate_summary_markdown(analysis_data, combined_tasks)
+                # Imported here so the generators only load when Markdown is requested
+                import bpmn_analyzer
+
+                generator_name, needs_analysis = MARKDOWN_GENERATORS[export_scope]
+                generator = getattr(bpmn_analyzer, generator_name)
+                if needs_analysis:
+                    markdown_content = generator(analysis_data, combined_tasks)
+                else:
+                    markdown_content = generator(combined_tasks)
 
                 st.download_button(
                     label="📥 Download Markdown Report",
                     data=markdown_content,
-                    file_name=f"bpmn_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
+                    file_name=f"bpmn_analysis_{ts}.md",
                     mime="text/markdown"
                 )
 
@@ -513,177 +674,26 @@ else:
         elif export_format == "JSON":
             # Export as JSON
             try:
+                json_data = None
                 if export_scope == "Complete Analysis":
-                    json_data = json.dumps(analysis_data, indent=2, default=str)
+                    json_data = dumps_json(analysis_data, pretty_json)
                 elif export_scope == "Tasks Only":
-                    json_data = json_data = json.dumps(combined_tasks, indent=2, default=str)
-                elif export_scope == "Issues & Opportunities Only":
-                    # Export only issues and opportunities data
-                    issues_opportunities_data = []
-                    for task in combined_tasks:
-                        # Add opportunities
-                        opportunities = task.get('opportunities', '')
-                        if opportunities and opportunities.strip():
-                            issues_opportunities_data.append({
-                                'type': 'Opportunity',
-                                'task_name': task.get('name', 'Unknown'),
-                                'department': task.get('swimlane', 'Unknown'),
-                                'owner': task.get('task_owner', 'Unknown'),
-                                'content': opportunities,
-                                'current_cost': task.get('total_cost', 0),
-                                'current_time_hours': task.get('time_hours', 0),
-                                'status': task.get('task_status', 'Unknown'),
-                                'tools_used': task.get('tools_used', 'N/A')
-                            })
-
-                        # Add issues
-                        issues_text = task.get('issues_text', '')
-                        if issues_text and issues_text.strip():
-                            issues_opportunities_data.append({
-                                'type': 'Issue/Risk',
-                                'task_name': task.get('name', 'Unknown'),
-                                'department': task.get('swimlane', 'Unknown'),
-                                'owner': task.get('task_owner', 'Unknown'),
-                                'content': issues_text,
-                                'priority': task.get('issues_priority', 'Unknown'),
-                                'current_cost': task.get('total_cost', 0),
-                                'current_time_hours': task.get('time_hours', 0),
-                                'status': task.get('task_status', 'Unknown'),
-                                'tools_used': task.get('tools_used', 'N/A')
-                            })
-
-                    if issues_opportunities_data:
-                        json_data = json.dumps(issues_opportunities_data, indent=2, default=str)
-                    else:
-                        st.warning("⚠️ No issues or opportunities found in the data")
-
-                elif export_scope == "FAQ Knowledge Only":
-                    # Export only FAQ data
-                    faq_data = []
-                    for task in combined_tasks:
-                        # Check for FAQ fields
-                        faq_fields = ['faq_q1', 'faq_a1', 'faq_q2', 'faq_a2', 'faq_q3', 'faq_a3']
-                        task_has_faqs = False
-
-                        for i in range(1, 4):
-                            q_key = f'faq_q{i}'
-                            a_key = f'faq_a{i}'
-                            question = task.get(q_key, '')
-                            answer = task.get(a_key, '')
-
-                            if question and question.strip() and answer and answer.strip():
-                                task_has_faqs = True
-                                faq_data.append({
-                                    'type': 'FAQ',
-                                    'task_name': task.get('name', 'Unknown'),
-                                    'department': task.get('swimlane', 'Unknown'),
-                                    'owner': task.get('task_owner', 'Unknown'),
-                                    'faq_number': i,
-                                    'question': question.strip(),
-                                    'answer': answer.strip(),
-                                    'current_cost': task.get('total_cost', 0),
-                                    'current_time_hours': task.get('time_hours', 0),
-                                    'status': task.get('task_status', 'Unknown'),
-                                    'tools_used': task.get('tools_used', 'N/A')
-                                })
-
-                        # If no FAQs found, add a placeholder row
-                        if not task_has_faqs:
-                            faq_data.append({
-                                'type': 'FAQ',
-                                'task_name': task.get('name', 'Unknown'),
-                                'department': task.get('swimlane', 'Unknown'),
-                                'owner': task.get('task_owner', 'Unknown'),
-                                'faq_number': 'N/A',
-                                'question': 'No FAQ captured',
-                                'answer': 'No FAQ captured',
-                                'current_cost': task.get('total_cost', 0),
-                                'current_time_hours': task.get('time_hours', 0),
-                                'status': task.get('task_status', 'Unknown'),
-                                'tools_used': task.get('tools_used', 'N/A')
-                            })
-
-                    if faq_data:
-                        json_data = json.dumps(faq_data, indent=2, default=str)
-                    else:
-                        st.warning("⚠️ No FAQ data found in the tasks")
-                elif export_scope == "Documentation Status Only":
-                    # Export only documentation status data
-                    doc_status_data = []
-                    for task in combined_tasks:
-                        doc_status_data.append({
-                            'type': 'Documentation',
-                            'task_name': task.get('name', 'Unknown'),
-                            'department': task.get('swimlane', 'Unknown'),
-                            'owner': task.get('task_owner', 'Unknown'),
-                            'documentation_status': task.get('doc_status', 'Unknown'),
-                            'documentation_url': task.get('doc_url', '') or 'N/A',  # Empty/NR/NO URL shows as N/A
-                            'current_cost': task.get('total_cost', 0),
-                            'current_time_hours': task.get('time_hours', 0),
-                            'status': task.get('task_status', 'Unknown'),
-                            'tools_used': task.get('tools_used', 'N/A')
-                        })
-
-                    if doc_status_data:
-                        json_data = json.dumps(doc_status_data, indent=2, default=str)
-                    else:
-                        st.warning("⚠️ No documentation status data found")
-                elif export_scope == "Tools Analysis Only":
-                    # Export only tools analysis data
-                    tools_data = []
-                    for task in combined_tasks:
-                        tools = task.get('tools_used', '')
-                        if tools and tools.strip():
-                            # Split tools and add each one
-                            tool_list = [tool.strip() for tool in tools.split(',') if tool.strip()]
-                            for tool in tool_list:
-                                tools_data.append({
-                                    'type': 'Tool',
-                                    'task_name': task.get('name', 'Unknown'),
-                                    'department': task.get('swimlane', 'Unknown'),
-                                    'owner': task.get('task_owner', 'Unknown'),
-                                    'tool_used': tool,
-                                    'original_tools_field': tools,
-                                    'current_cost': task.get('total_cost', 0),
-                                    'current_time_hours': task.get('time_hours', 0),
-                                    'status': task.get('task_status', 'Unknown')
-                                })
-                        else:
-                            # Task with no tools
-                            tools_data.append({
-                                'type': 'Tool',
-                                'task_name': task.get('name', 'Unknown'),
-                                'department': task.get('swimlane', 'Unknown'),
-                                'owner': task.get('task_owner', 'Unknown'),
-                                'tool_used': 'No tools specified',
-                                'original_tools_field': 'N/A',
-                                'current_cost': task.get('total_cost', 0),
-                                'current_time_hours': task.get('time_hours', 0),
-                                'status': task.get('task_status', 'Unknown')
-                            })
-
-                    if tools_data:
-                        json_data = json.dumps(tools_data, indent=2, default=str)
-                    else:
-                        st.warning("⚠️ No tools data found in the tasks")
+                    json_data = dumps_json(combined_tasks, pretty_json)
+                elif export_scope in JSON_ROW_SCOPES:
+                    # Export one focused scope, encoded only for this click
+                    json_data = _build_json_export(combined_tasks, export_scope, pretty_json)
+                    if json_data is None:
+                        st.warning(EXPORT_SCHEMAS[export_scope]['empty_message'])
                 else:  # Summary Only
-                    summary_data = {
-                        'summary': {
-                            'total_tasks': len(combined_tasks),
-                            'total_cost': analysis_data.get('total_costs', 0),
-                            'total_time_hours': analysis_data.get('total_time', 0) / 60,
-                            'departments_count': len(set(task.get('swimlane', 'Unknown') for task in combined_tasks)),
-                            'owners_count': len(set(task.get('task_owner', 'Unknown') for task in combined_tasks))
-                        }
-                    }
-                    json_data = json.dumps(summary_data, indent=2, default=str)
+                    json_data = dumps_json({'summary': _summary_metrics(combined_tasks, analysis_data)}, pretty_json)
 
-                st.download_button(
-                    label="📥 Download JSON",
-                    data=json_data,
-                    file_name=f"bpmn_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                    mime="application/json"
-                )
+                if json_data is not None:
+                    st.download_button(
+                        label="📥 Download JSON",
+                        data=json_data,
+                        file_name=f"bpmn_analysis_{ts}.json",
+                        mime="application/json"
+                    )
 
             except Exception as e:
                 st.error(f"❌ Error generating JSON: {str(e)}")
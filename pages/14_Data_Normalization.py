@@ -3,27 +3,102 @@
 This page explains all normalization rules applied to the data.
 """
 import streamlit as st
-import pandas as pd
-from utils.shared import setup_file_upload, get_combined_tasks, get_analysis_data, has_data, render_page_header, render_sidebar_header
-
-# Render sidebar header
-render_sidebar_header()
-
-# Set up file upload in sidebar (visible on all pages)
-setup_file_upload()
-
-# Render page header
-render_page_header("Data Normalization Guide", "📋")
-
-# Check if data is available (optional for this informational page)
-if has_data():
-    combined_tasks = get_combined_tasks()
-    st.info(f"📊 You have {len(combined_tasks)} tasks loaded. Normalization is applied to this data.")
-
-st.markdown("---")
+from utils.shared import setup_file_upload, get_combined_task_count, render_page_header, render_sidebar_header
+
+
+def _md_cell(value):
+    """Format one rule-table cell; None, empty and non-string inputs are shown as code."""
+    if not isinstance(value, str) or value == '':
+        return f"`{value!r}`"
+    return value.replace('|', '\\|')
+
+
+def _md_table(columns):
+    """
+    Render a dict of column name -> values as a Markdown pipe table.
+    
+    Args:
+        columns: Dict mapping each column header to its list of cell values
+        
+    Returns:
+        Markdown table string
+    """
+    lines = [
+        '| ' + ' | '.join(columns) + ' |',
+        '|' + ' --- |' * len(columns)
+    ]
+    for row in zip(*columns.values()):
+        lines.append('| ' + ' | '.join(_md_cell(value) for value in row) + ' |')
+    return '\n'.join(lines)
+
+
+def _rule_tables():
+    """
+    Build the static normalization rule tables shown on this page as Markdown.
+    
+    Returns:
+        Tuple of (doc_url_rules, doc_status_rules, task_status_rules, before_after_example) Markdown tables
+    """
+    doc_url_rules = _md_table({
+        'Input Value': ['NR', 'NO URL', 'No URL', 'nourl', 'unknown', '', 'None', None, 'Valid URL'],
+        'Normalized To': ['Empty string', 'Empty string', 'Empty string', 'Empty string', 'Empty string', 'Empty string', 'Empty string', 'Empty string', 'Kept as-is'],
+        'Case Sensitive?': ['No', 'No', 'No', 'No', 'No', 'N/A', 'N/A', 'N/A', 'N/A']
+    })
+
+    doc_status_rules = _md_table({
+        'Input Value': ['', 'None', None, 'unknown', 'Unknown', 'UNKNOWN', 'Valid Status'],
+        'Normalized To': ["'Unknown'", "'Unknown'", "'Unknown'", "'Unknown'", "'Unknown'", "'Unknown'", 'Kept as-is'],
+        'Case Sensitive?': ['N/A', 'N/A', 'N/A', 'No', 'No', 'No', 'Yes']
+    })
+
+    task_status_rules = _md_table({
+        'Input Value': ['', '0', 0, 'None', None, 'unknown', 'Unknown', 'Valid Status'],
+        'Normalized To': ["'Unknown'", "'Unknown'", "'Unknown'", "'Unknown'", "'Unknown'", "'Unknown'", "'Unknown'", 'Kept as-is'],
+        'Case Sensitive?': ['N/A', 'N/A', 'N/A', 'N/A', 'N/A', 'No', 'No', 'Yes']
+    })
+
+    before_after_example = _md_table({
+        'Metric': [
+            'Status "0"',
+            'Status "" (empty)',
+            'Status "unknown"',
+            'Status "Unknown"',
+            'Document URL "NR"',
+            'Document Status "" (empty)'
+        ],
+        'Before': [
+            'Shown as "0" (separate category)',
+            'Shown as "" (separate category)',
+            'Shown as "unknown" (separate category)',
+            'Shown as "Unknown"',
+            'Shown as "NR" (valid URL?)',
+            'Shown as "" (separate category)'
+        ],
+        'After': [
+            'Grouped as "Unknown"',
+            'Grouped as "Unknown"',
+            'Grouped as "Unknown"',
+            'Grouped as "Unknown"',
+            'Treated as empty/N/A',
+            'Grouped as "Unknown"'
+        ],
+        'Benefit': [
+            'Consistent categorization',
+            'Consistent categorization',
+            'Consistent categorization',
+            'Consistent categorization',
+            'Clear indication of missing data',
+            'Consistent categorization'
+        ]
+    })
+
+    return doc_url_rules, doc_status_rules, task_status_rules, before_after_example
+
+
+# Guide text; the {placeholders} receive the Markdown tables from _rule_tables()
+GUIDE_MD = """
+---
 
-# Introduction
-st.markdown("""
 ## 📋 What is Data Normalization?
 
 Data normalization is the process of **standardizing and cleaning data values** to ensure consistency across the application. 
@@ -44,18 +119,9 @@ This helps provide accurate analysis, avoids duplicate categories, and improves
 **Purpose**: Clean up document URLs and handle "not available" cases.
 
 **Normalization Rules**:
-""")
-
-# Create a table for document URL normalization
-doc_url_rules = pd.DataFrame({
-    'Input Value': ['NR', 'NO URL', 'No URL', 'nourl', 'unknown', '', 'None', None, 'Valid URL'],
-    'Normalized To': ['Empty string', 'Empty string', 'Empty string', 'Empty string', 'Empty string', 'Empty string', 'Empty string', 'Empty string', 'Kept as-is'],
-    'Case Sensitive?': ['No', 'No', 'No', 'No', 'No', 'N/A', 'N/A', 'N/A', 'N/A']
-})
 
-st.dataframe(doc_url_rules, use_container_width=True, hide_index=True)
+{doc_url_rules}
 
-st.markdown("""
 **Where Applied**: 
 - Task parsing (`bpmn_analyzer.py`)
 - Document URL display (Tasks Overview, Documentation Status)
@@ -67,28 +133,17 @@ st.markdown("""
 # After normalization: doc_url = "" (empty string)
 # Display shows: "(empty)" or "N/A"
 ```
-""")
 
-st.markdown("---")
+---
 
-### Document Status Normalization
-st.markdown("""
 ### 2️⃣ Document Status Normalization
 
 **Purpose**: Standardize document status values and handle missing/empty statuses.
 
 **Normalization Rules**:
-""")
-
-doc_status_rules = pd.DataFrame({
-    'Input Value': ['', 'None', None, 'unknown', 'Unknown', 'UNKNOWN', 'Valid Status'],
-    'Normalized To': ["'Unknown'", "'Unknown'", "'Unknown'", "'Unknown'", "'Unknown'", "'Unknown'", 'Kept as-is'],
-    'Case Sensitive?': ['N/A', 'N/A', 'N/A', 'No', 'No', 'No', 'Yes']
-})
 
-st.dataframe(doc_status_rules, use_container_width=True, hide_index=True)
+{doc_status_rules}
 
-st.markdown("""
 **Valid Document Status Values**:
 - ✅ **"Documented"**: Task has complete documentation
 - ✅ **"Documentation Not Needed"**: Task doesn't require documentation
@@ -108,28 +163,17 @@ st.markdown("""
 # After normalization: doc_status = "Unknown"
 # Display shows: "❓ Unknown"
 ```
-""")
 
-st.markdown("---")
+---
 
-### Task Status Normalization
-st.markdown("""
 ### 3️⃣ Task Status Normalization
 
 **Purpose**: Standardize task status values, especially handling empty/null/zero values.
 
 **Normalization Rules**:
-""")
-
-task_status_rules = pd.DataFrame({
-    'Input Value': ['', '0', 0, 'None', None, 'unknown', 'Unknown', 'Valid Status'],
-    'Normalized To': ["'Unknown'", "'Unknown'", "'Unknown'", "'Unknown'", "'Unknown'", "'Unknown'", "'Unknown'", 'Kept as-is'],
-    'Case Sensitive?': ['N/A', 'N/A', 'N/A', 'N/A', 'N/A', 'No', 'No', 'Yes']
-})
 
-st.dataframe(task_status_rules, use_container_width=True, hide_index=True)
+{task_status_rules}
 
-st.markdown("""
 **Common Task Status Values**:
 - ✅ **"OK"**: Task is in good standing
 - ⚠️ **"Requires Attention"**: Task needs review or action
@@ -153,12 +197,9 @@ st.markdown("""
 
 **Why This Matters**: 
 In your data, you may have **140 tasks with status "0"**. These will all be grouped under **"Unknown"** instead of showing as separate "0" entries, making the analysis cleaner and more meaningful.
-""")
 
-st.markdown("---")
+---
 
-### Additional Normalizations
-st.markdown("""
 ### 4️⃣ Additional Data Cleaning
 
 **Currency Normalization**:
@@ -177,55 +218,15 @@ st.markdown("""
 **Process Reference**:
 - Added to all tasks to track source process
 - Empty → `'Unknown'`
-""")
 
-st.markdown("---")
+---
 
-### Impact Section
-st.markdown("""
 ## 📊 Impact of Normalization
 
 ### Before Normalization:
-""")
-
-before_after_example = pd.DataFrame({
-    'Metric': [
-        'Status "0"',
-        'Status "" (empty)',
-        'Status "unknown"',
-        'Status "Unknown"',
-        'Document URL "NR"',
-        'Document Status "" (empty)'
-    ],
-    'Before': [
-        'Shown as "0" (separate category)',
-        'Shown as "" (separate category)',
-        'Shown as "unknown" (separate category)',
-        'Shown as "Unknown"',
-        'Shown as "NR" (valid URL?)',
-        'Shown as "" (separate category)'
-    ],
-    'After': [
-        'Grouped as "Unknown"',
-        'Grouped as "Unknown"',
-        'Grouped as "Unknown"',
-        'Grouped as "Unknown"',
-        'Treated as empty/N/A',
-        'Grouped as "Unknown"'
-    ],
-    'Benefit': [
-        'Consistent categorization',
-        'Consistent categorization',
-        'Consistent categorization',
-        'Consistent categorization',
-        'Clear indication of missing data',
-        'Consistent categorization'
-    ]
-})
 
-st.dataframe(before_after_example, use_container_width=True, hide_index=True)
+{before_after_example}
 
-st.markdown("""
 ### Benefits:
 1. **🎯 Accurate Statistics**: No duplicate categories affecting counts
 2. **📊 Clean Reports**: Consistent display across all pages
@@ -313,12 +314,40 @@ If you notice inconsistencies in how data is displayed or normalized, please che
 ---
 
 *Last updated: 2025-01-28*
-""")
 
-# Footer
-st.markdown("---")
-st.markdown("""
+---
+
 **💡 Tip**: Use this page as a reference when analyzing your data or troubleshooting display issues. 
 All normalization happens automatically to ensure data consistency across the entire application!
-""")
+"""
+
+
+def _guide_markdown():
+    """Fill GUIDE_MD with the rule tables (called once per session, see below)."""
+    doc_url_rules, doc_status_rules, task_status_rules, before_after_example = _rule_tables()
+    return GUIDE_MD.format(
+        doc_url_rules=doc_url_rules,
+        doc_status_rules=doc_status_rules,
+        task_status_rules=task_status_rules,
+        before_after_example=before_after_example
+    )
 
+
+# Render sidebar header
+render_sidebar_header()
+
+# Set up file upload in sidebar (visible on all pages)
+setup_file_upload()
+
+# Render page header
+render_page_header("Data Normalization Guide", "📋")
+
+# Check if data is available (optional for this informational page)
+task_count = get_combined_task_count()
+if task_count:
+    st.info(f"📊 You have {task_count} tasks loaded. Normalization is applied to this data.")
+
+# The whole guide is one Markdown element, assembled once and kept for the session
+if "norm_guide_md" not in st.session_state:
+    st.session_state["norm_guide_md"] = _guide_markdown()
+st.markdown(st.session_state["norm_guide_md"])
@@ -7,6 +7,43 @@ This script checks dependencies and launches the Streamlit application.
 import subprocess
 import sys
 import os
+import shutil
+import hashlib
+import compileall
+from importlib.util import find_spec
+from concurrent.futures import ThreadPoolExecutor
+
+# Written after a passing dependency check; holds the signature of what was checked
+DEPS_SENTINEL = ".deps_ok"
+
+def deps_signature():
+    """Hash requirements.txt together with the interpreter path, or None if it cannot be read."""
+    try:
+        with open("requirements.txt", "rb") as f:
+            requirements = f.read()
+    except OSError:
+        return None
+    return hashlib.blake2b(requirements + sys.executable.encode(), digest_size=8).hexdigest()
+
+def deps_already_checked(signature):
+    """Return True if the sentinel records a passing check for this signature."""
+    if signature is None:
+        return False
+    try:
+        with open(DEPS_SENTINEL, encoding="utf-8", errors="ignore") as f:
+            return f.read().strip() == signature
+    except OSError:
+        return False
+
+def mark_deps_checked(signature):
+    """Record a passing dependency check; failing to write only costs a re-check next launch."""
+    if signature is None:
+        return
+    try:
+        with open(DEPS_SENTINEL, "w", encoding="utf-8") as f:
+            f.write(signature)
+    except OSError:
+        pass
 
 def check_dependencies():
     """Check if required packages are installed."""
@@ -19,21 +56,31 @@ def check_dependencies():
         'openpyxl'
     ]
     
-    missing_packages = []
+    # Packages that are already imported need no lookup at all
+    to_probe = [package for package in required_packages if package not in sys.modules]
     
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
+    # find_spec only locates each package; it does not run its import-time code.
+    # The lookups are independent filesystem walks, so probe them concurrently.
+    if to_probe:
+        with ThreadPoolExecutor(max_workers=len(to_probe)) as executor:
+            specs = list(executor.map(find_spec, to_probe))
+    else:
+        specs = []
+    
+    missing_packages = [package for package, spec in zip(to_probe, specs) if spec is None]
     
     return missing_packages
 
 def install_dependencies():
     """Install missing dependencies."""
     print("Installing missing dependencies...")
+    # Prefer uv's much faster resolver when it is on PATH; same requirements.txt either way
+    if shutil.which("uv"):
+        command = ["uv", "pip", "install", "--python", sys.executable, "-r", "requirements.txt"]
+    else:
+        command = [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"]
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        subprocess.check_call(command)
         print("✅ Dependencies installed successfully!")
         return True
     except subprocess.CalledProcessError:
@@ -52,17 +99,28 @@ def main():
         print("Please run this script from the project directory.")
         sys.exit(1)
     
-    # Check dependencies
-    print("🔍 Checking dependencies...")
-    missing = check_dependencies()
-    
-    if missing:
-        print(f"❌ Missing packages: {', '.join(missing)}")
-        print("Installing dependencies...")
-        if not install_dependencies():
-            sys.exit(1)
+    # Check dependencies, unless this requirements.txt already passed with this interpreter
+    signature = deps_signature()
+    if deps_already_checked(signature):
+        print("✅ Dependencies already verified for this environment")
     else:
-        print("✅ All dependencies are installed!")
+        print("🔍 Checking dependencies...")
+        missing = check_dependencies()
+        
+        if missing:
+            print(f"❌ Missing packages: {', '.join(missing)}")
+            print("Installing dependencies...")
+            if not install_dependencies():
+                sys.exit(1)
+        else:
+            print("✅ All dependencies are installed!")
+        mark_deps_checked(signature)
+    
+    # Byte-compile the modules the pages import so their first import skips it;
+    # compileall leaves files with an up-to-date .pyc alone. Page scripts are
+    # compiled by Streamlit itself and do not use .pyc files.
+    compileall.compile_file("bpmn_analyzer.py", quiet=1)
+    compileall.compile_dir("utils", quiet=1)
     
     # Launch the application
     print("🌐 Launching BPMN Analysis Tool...")
@@ -70,11 +128,24 @@ def main():
     print("If it doesn't open automatically, navigate to: http://localhost:8501")
     print("=" * 50)
     
+    command = [sys.executable, "-m", "streamlit", "run", "bpmn_analyzer.py"]
+    
+    if os.name == "nt":
+        # exec does not replace the process on Windows, so keep the child process there
+        try:
+            subprocess.run(command)
+        except KeyboardInterrupt:
+            print("\n👋 Application stopped by user.")
+        except Exception as e:
+            print(f"❌ Error launching application: {e}")
+            print("Try running manually: streamlit run bpmn_analyzer.py")
+        return
+    
+    # Replace this launcher with Streamlit so no idle Python process stays behind
+    sys.stdout.flush()
     try:
-        subprocess.run([sys.executable, "-m", "streamlit", "run", "bpmn_analyzer.py"])
-    except KeyboardInterrupt:
-        print("\n👋 Application stopped by user.")
-    except Exception as e:
+        os.execvp(sys.executable, command)
+    except OSError as e:
         print(f"❌ Error launching application: {e}")
         print("Try running manually: streamlit run bpmn_analyzer.py")
 
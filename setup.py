@@ -14,6 +14,7 @@ setup(
         "numpy>=1.21.0,<2.0.0",
         "openpyxl>=3.1.0",
         "python-dateutil>=2.8.0",
+        "orjson>=3.9.0",
     ],
     python_requires=">=3.8",
     classifiers=[
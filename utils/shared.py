@@ -3,13 +3,18 @@ Shared utilities for BPMN Analysis app.
 Provides session state management and common functions for all pages.
 """
 import streamlit as st
-from typing import Dict, List, Any, Optional
+from collections import defaultdict
+from functools import partial
+from itertools import chain
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Any, NamedTuple, Optional
 
 
 # Inocta Branding Constants
 INOCTA_LOGO_WHITE_URL = "https://inocta.io/wp-content/uploads/2025/03/inocta-logo-primary-white-rgb-4090px-w-72ppi.png"
 INOCTA_LOGO_URL = "https://inocta.io/wp-content/uploads/2024/06/inocta-logo-secondary-full-color-rgb-4090px-w-72ppi.png"
-INOCTA_COLORS = {
+INOCTA_COLORS = MappingProxyType({
     'slate': '#43505B',
     'deep_teal': '#50817C',
     'terracotta': '#CE8365',
@@ -23,18 +28,38 @@ INOCTA_COLORS = {
     'danger': '#962531',
     'warning': '#D18F33',
     'success': '#4A7C59'
-}
+})
 APP_VERSION = "v3.5.0"
 APP_NAME = "Inocta BPM Analysis"
 
+# Static sidebar footer, formatted once at import
+SIDEBAR_FOOTER_MD = f"&nbsp;\n\n**📊 {APP_NAME}**  \n*Version: {APP_VERSION}*"
+
+# Page header markup with the brand colors and version filled in once at import;
+# only the %(icon)s and %(title)s placeholders are substituted per render
+_HEADER_TEMPLATE = f"""
+    <div style="margin-bottom: 2rem; padding-bottom: 1rem; border-bottom: 2px solid {INOCTA_COLORS['light_teal']};">
+        <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 8px;">
+            <span style="font-size: 32px;">%(icon)s</span>
+            <h1 style="margin: 0; color: {INOCTA_COLORS['deep_teal']}; font-family: 'Poppins', sans-serif; font-weight: 600; font-size: 2rem;">
+                %(title)s
+            </h1>
+        </div>
+        <p style="margin: 0; color: {INOCTA_COLORS['slate']}; font-family: 'Roboto', sans-serif; font-size: 0.9rem;">
+            Version {APP_VERSION}
+        </p>
+    </div>
+    """
+
+
+class StoredFile(NamedTuple):
+    """Name and size of an uploaded file, kept in session state without its content."""
+    name: str
+    size: int
+
 
 def init_session_state():
     """Initialize session state variables if they don't exist."""
-    if 'analyzer' not in st.session_state:
-        # Import here to avoid circular imports
-        from bpmn_analyzer import BPMNAnalyzer
-        st.session_state.analyzer = BPMNAnalyzer()
-    
     if 'uploaded_files' not in st.session_state:
         st.session_state.uploaded_files = None
     
@@ -48,43 +73,105 @@ def init_session_state():
         st.session_state.analysis_data = {}
 
 
-def setup_file_upload():
-    """Set up file upload section in sidebar - available on all pages."""
+def _upload_signature(uploaded_files: List) -> tuple:
+    """
+    Identify a set of uploads for change detection.
+    
+    Streamlit gives every upload its own file_id, so re-uploading a changed
+    file under the same name is still detected; plain names are the fallback.
+    
+    Args:
+        uploaded_files: List of uploaded file objects
+        
+    Returns:
+        Tuple of file ids (or names), in upload order
+    """
+    return tuple(getattr(f, 'file_id', f.name) for f in uploaded_files)
+
+
+def _clear_uploaded_files():
+    """Drop the uploaded files and their analysis from session state and rerun."""
+    st.session_state.uploaded_files = None
+    st.session_state.all_analysis_data = []
+    st.session_state.combined_tasks = []
+    st.session_state.analysis_data = {}
+    st.session_state._has_data = False
+    st.session_state._files_sig = None
+    st.rerun()
+
+
+def _render_uploaded_files(target, filenames: List[str], sidebar: bool):
+    """
+    Render the list of uploaded file names.
+    
+    Args:
+        target: Streamlit container to write into (st.sidebar or st)
+        filenames: Names of the uploaded files
+        sidebar: True for the sidebar layout, False for the main-area layout
+                 with the clear button next to the list
+    """
+    # One markdown element for the whole list (hard line breaks between names)
+    # instead of one element per file
+    file_list_md = "  \n".join(f"📄 {filename}" for filename in filenames)
+    if sidebar:
+        target.markdown(f"**Uploaded Files:**  \n{file_list_md}")
+        return
+    
+    st.markdown("**📄 Uploaded Files:**")
+    file_col1, file_col2 = st.columns([3, 1])
+    with file_col1:
+        st.markdown(file_list_md)
+    with file_col2:
+        if st.button("🗑️ Clear Files", key="clear_files_btn", type="secondary"):
+            _clear_uploaded_files()
+
+
+def _setup_file_upload(sidebar: bool):
+    """
+    Set up the file upload section in the sidebar or the main content area.
+    
+    Args:
+        sidebar: True to render into the sidebar, False for the main content area
+    """
     # Initialize session state
     init_session_state()
     
     # Get analyzer instance
     analyzer = get_analyzer()
     
-    # File upload in sidebar - Streamlit-native
-    st.sidebar.header("📁 File Upload")
+    # st.sidebar exposes the same element API as st, so one code path serves both
+    target = st.sidebar if sidebar else st
+    
+    # File upload section - Streamlit-native
+    if sidebar:
+        st.sidebar.header("📁 File Upload")
+    else:
+        st.markdown("---")
+        st.markdown("### 📁 File Upload")
     
     # Check if we already have files in session state
-    has_stored_files = (st.session_state.uploaded_files is not None and 
-                       hasattr(st.session_state.uploaded_files, '__len__') and 
-                       len(st.session_state.uploaded_files) > 0)
+    # (None or a list of StoredFile entries, so plain truthiness covers both)
+    has_stored_files = bool(st.session_state.uploaded_files)
     
     # Also check if we have analysis data (more reliable indicator)
     has_analysis_data = (st.session_state.all_analysis_data is not None and 
                         len(st.session_state.all_analysis_data) > 0)
     
     # File uploader - this will return None when navigating between pages
-    uploaded_files = st.sidebar.file_uploader(
+    uploaded_files = target.file_uploader(
         "Upload BPMN XML files",
         type=['xml', 'bpmn'],
         accept_multiple_files=True,
         help="Upload one or more BPMN XML files for analysis",
-        key="file_uploader_sidebar"
+        key="file_uploader_sidebar" if sidebar else "file_uploader_main"
     )
     
     # Process files if new files uploaded
     if uploaded_files:
-        # Check if files have changed (new upload)
-        current_files = [f.name for f in uploaded_files]
-        stored_files = [f.name for f in st.session_state.uploaded_files] if st.session_state.uploaded_files else []
-        
-        if current_files != stored_files:
-            st.sidebar.success(f"✅ {len(uploaded_files)} file(s) uploaded")
+        # Check if files have changed (new upload) against the signature saved
+        # by update_analysis_data
+        if _upload_signature(uploaded_files) != st.session_state.get('_files_sig'):
+            target.success(f"✅ {len(uploaded_files)} file(s) uploaded")
             
             # Process uploaded files
             all_analysis_data = process_uploaded_files(analyzer, uploaded_files)
@@ -98,144 +185,74 @@ def setup_file_upload():
         
         # Show uploaded files list
         if st.session_state.uploaded_files:
-            st.sidebar.markdown("**Uploaded Files:**")
-            for file in st.session_state.uploaded_files:
-                st.sidebar.write(f"📄 {file.name}")
+            _render_uploaded_files(target, [f.name for f in st.session_state.uploaded_files], sidebar)
     elif has_stored_files or has_analysis_data:
         # We have files/data in session state but file_uploader returned None (page navigation)
         # Keep the existing files and data - don't clear them!
         if has_stored_files:
-            st.sidebar.info(f"📄 {len(st.session_state.uploaded_files)} file(s) loaded")
-            st.sidebar.markdown("**Uploaded Files:**")
-            for file in st.session_state.uploaded_files:
-                st.sidebar.write(f"📄 {file.name}")
-        elif has_analysis_data:
+            target.info(f"📄 {len(st.session_state.uploaded_files)} file(s) loaded")
+            filenames = [f.name for f in st.session_state.uploaded_files]
+        else:
             # Show file count from analysis data if we don't have file objects
-            file_count = len(st.session_state.all_analysis_data)
-            st.sidebar.info(f"📄 {file_count} file(s) loaded")
-            st.sidebar.markdown("**Uploaded Files:**")
-            for data in st.session_state.all_analysis_data:
-                filename = data.get('filename', 'Unknown')
-                st.sidebar.write(f"📄 {filename}")
+            target.info(f"📄 {len(st.session_state.all_analysis_data)} file(s) loaded")
+            filenames = [data.get('filename', 'Unknown') for data in st.session_state.all_analysis_data]
+        _render_uploaded_files(target, filenames, sidebar)
         
-        # Add a button to clear files
-        if st.sidebar.button("🗑️ Clear Files", key="clear_files_btn_sidebar"):
-            st.session_state.uploaded_files = None
-            st.session_state.all_analysis_data = []
-            st.session_state.combined_tasks = []
-            st.session_state.analysis_data = {}
-            st.rerun()
-    else:
-        # No files in session state and no new uploads - this is the initial state
-        pass
+        # Add a button to clear files (the main-area layout has its own next to the list)
+        if sidebar and st.sidebar.button("🗑️ Clear Files", key="clear_files_btn_sidebar"):
+            _clear_uploaded_files()
+    # Otherwise no files in session state and no new uploads - this is the initial state
+
+
+def setup_file_upload():
+    """Set up file upload section in sidebar - available on all pages."""
+    _setup_file_upload(sidebar=True)
 
 
 def setup_file_upload_main():
     """Set up file upload section on main page content area (not sidebar)."""
-    # Initialize session state
-    init_session_state()
-    
-    # Get analyzer instance
-    analyzer = get_analyzer()
-    
-    # File upload in main content area - Streamlit-native
-    st.markdown("---")
-    st.markdown("### 📁 File Upload")
-    
-    # Check if we already have files in session state
-    has_stored_files = (st.session_state.uploaded_files is not None and 
-                       hasattr(st.session_state.uploaded_files, '__len__') and 
-                       len(st.session_state.uploaded_files) > 0)
+    _setup_file_upload(sidebar=False)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_analyzer():
+    """Create the process-wide BPMNAnalyzer, shared by every session."""
+    # Import here to avoid circular imports
+    from bpmn_analyzer import BPMNAnalyzer
+    return BPMNAnalyzer()
+
+
+def get_analyzer():
+    """
+    Get the shared BPMNAnalyzer instance.
     
-    # Also check if we have analysis data (more reliable indicator)
-    has_analysis_data = (st.session_state.all_analysis_data is not None and 
-                        len(st.session_state.all_analysis_data) > 0)
+    The analyzer keeps no per-parse state, so one instance cached with
+    st.cache_resource serves all sessions instead of one per session.
+    """
+    return _get_analyzer()
+
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, max_entries=64)
+def _analyze_file(_analyzer, file_bytes: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Parse one BPMN file and analyze its business insights.
     
-    # File uploader - this will return None when navigating between pages
-    uploaded_files = st.file_uploader(
-        "Upload BPMN XML files",
-        type=['xml', 'bpmn'],
-        accept_multiple_files=True,
-        help="Upload one or more BPMN XML files for analysis",
-        key="file_uploader_main"
-    )
+    Cached on the file bytes, so re-uploading or re-processing an identical
+    file reuses the earlier result. The analyzer is stateless for these calls
+    and is left out of the cache key (leading underscore).
     
-    # Process files if new files uploaded
-    if uploaded_files:
-        # Check if files have changed (new upload)
-        current_files = [f.name for f in uploaded_files]
-        stored_files = [f.name for f in st.session_state.uploaded_files] if st.session_state.uploaded_files else []
-        
-        if current_files != stored_files:
-            st.success(f"✅ {len(uploaded_files)} file(s) uploaded")
-            
-            # Process uploaded files
-            all_analysis_data = process_uploaded_files(analyzer, uploaded_files)
-            
-            # Update session state with analysis data
-            if all_analysis_data:
-                update_analysis_data(uploaded_files, all_analysis_data)
-                
-                # Auto-redirect to Executive Summary page after successful upload
-                st.session_state.auto_redirect_to_exec = True
+    Args:
+        _analyzer: BPMNAnalyzer instance
+        file_bytes: Raw content of the uploaded file
         
-        # Show uploaded files list
-        if st.session_state.uploaded_files:
-            st.markdown("**📄 Uploaded Files:**")
-            file_col1, file_col2 = st.columns([3, 1])
-            with file_col1:
-                for file in st.session_state.uploaded_files:
-                    st.write(f"📄 {file.name}")
-            with file_col2:
-                if st.button("🗑️ Clear Files", key="clear_files_btn", type="secondary"):
-                    st.session_state.uploaded_files = None
-                    st.session_state.all_analysis_data = []
-                    st.session_state.combined_tasks = []
-                    st.session_state.analysis_data = {}
-                    st.rerun()
-    elif has_stored_files or has_analysis_data:
-        # We have files/data in session state but file_uploader returned None (page navigation)
-        # Keep the existing files and data - don't clear them!
-        if has_stored_files:
-            st.info(f"📄 {len(st.session_state.uploaded_files)} file(s) loaded")
-            st.markdown("**📄 Uploaded Files:**")
-            file_col1, file_col2 = st.columns([3, 1])
-            with file_col1:
-                for file in st.session_state.uploaded_files:
-                    st.write(f"📄 {file.name}")
-            with file_col2:
-                if st.button("🗑️ Clear Files", key="clear_files_btn", type="secondary"):
-                    st.session_state.uploaded_files = None
-                    st.session_state.all_analysis_data = []
-                    st.session_state.combined_tasks = []
-                    st.session_state.analysis_data = {}
-                    st.rerun()
-        elif has_analysis_data:
-            # Show file count from analysis data if we don't have file objects
-            file_count = len(st.session_state.all_analysis_data)
-            st.info(f"📄 {file_count} file(s) loaded")
-            st.markdown("**📄 Uploaded Files:**")
-            file_col1, file_col2 = st.columns([3, 1])
-            with file_col1:
-                for data in st.session_state.all_analysis_data:
-                    filename = data.get('filename', 'Unknown')
-                    st.write(f"📄 {filename}")
-            with file_col2:
-                if st.button("🗑️ Clear Files", key="clear_files_btn", type="secondary"):
-                    st.session_state.uploaded_files = None
-                    st.session_state.all_analysis_data = []
-                    st.session_state.combined_tasks = []
-                    st.session_state.analysis_data = {}
-                    st.rerun()
-    else:
-        # No files in session state and no new uploads - this is the initial state
-        pass
-
-
-def get_analyzer():
-    """Get or create BPMNAnalyzer instance from session state."""
-    init_session_state()
-    return st.session_state.analyzer
+    Returns:
+        Analysis data dictionary, or None if the file could not be parsed
+    """
+    # The XML parser takes the bytes as-is, so no separate UTF-8 decode copy is made
+    parsed_data = _analyzer.parse_bpmn_file(file_bytes)
+    if not parsed_data:
+        return None
+    return _analyzer.analyze_business_insights(parsed_data)
 
 
 def process_uploaded_files(analyzer, uploaded_files: List) -> List[Dict[str, Any]]:
@@ -250,32 +267,104 @@ def process_uploaded_files(analyzer, uploaded_files: List) -> List[Dict[str, Any
         List of analysis data dictionaries
     """
     all_analysis_data = []
-    
-    for uploaded_file in uploaded_files:
-        st.write(f"📄 {uploaded_file.name}")
-        
-        # Read file content
-        file_content = uploaded_file.read().decode('utf-8')
-        
-        # Parse BPMN file
-        with st.spinner(f"Analyzing {uploaded_file.name}..."):
-            parsed_data = analyzer.parse_bpmn_file(file_content)
+    if not uploaded_files:
+        return all_analysis_data
+    
+    # All progress goes into one collapsible status panel instead of separate
+    # write/success/error elements per file
+    with st.status(f"Analyzing {len(uploaded_files)} file(s)...", expanded=False) as status:
+        failed = 0
+        for uploaded_file in uploaded_files:
+            filename = uploaded_file.name
             
-            if parsed_data:
-                # Analyze business insights
-                analysis_data = analyzer.analyze_business_insights(parsed_data)
-                analysis_data['filename'] = uploaded_file.name
+            # Parse and analyze on the script thread (cached on the file bytes), so
+            # the parser's own st.error details land in this panel
+            analysis_data = _analyze_file(analyzer, uploaded_file.getvalue())
+            if analysis_data is not None:
+                analysis_data['filename'] = filename
                 all_analysis_data.append(analysis_data)
                 
-                # Show success with task count
-                task_count = len(parsed_data.get('tasks', []))
-                st.success(f"✅ Successfully analyzed {uploaded_file.name} - Found {task_count} tasks")
+                # Report success with task count
+                task_count = len(analysis_data.get('tasks', []))
+                status.write(f"✅ {filename} - Found {task_count} tasks")
             else:
-                st.error(f"❌ Failed to analyze {uploaded_file.name}")
+                failed += 1
+                status.write(f"❌ Failed to analyze {filename}")
+        
+        # Open the panel when something failed so the error is visible
+        if failed:
+            status.update(
+                label=f"Analyzed {len(all_analysis_data)} of {len(uploaded_files)} file(s) - {failed} failed",
+                state="error" if not all_analysis_data else "complete",
+                expanded=True
+            )
+        else:
+            status.update(label=f"✅ Successfully analyzed {len(uploaded_files)} file(s)", state="complete")
     
     return all_analysis_data
 
 
+# Numeric fields summed per category when merging the per-file analyses
+CATEGORY_MERGE_FIELDS = {
+    'swimlane_analysis': ('task_count', 'total_cost', 'total_time_minutes', 'total_time_hours'),
+    'owner_analysis': ('task_count', 'total_cost', 'total_time_minutes'),
+    'status_analysis': ('task_count', 'total_cost', 'total_time_minutes'),
+    'priority_analysis': ('task_count', 'total_cost', 'total_time_minutes'),
+    'doc_status_analysis': ('task_count', 'total_cost', 'total_time_minutes')
+}
+
+
+def _new_category_entry(fields: tuple, with_tasks: bool) -> Dict[str, Any]:
+    """Zeroed merged entry for one category value (default factory for the merge)."""
+    entry = dict.fromkeys(fields, 0)
+    if with_tasks:
+        # Per-file task lists, flattened into 'tasks' once the merge is done
+        entry['tasks_parts'] = []
+    return entry
+
+
+def _merge_category(dest: Dict[str, Any], src: Dict[str, Any], fields: tuple, with_tasks: bool = False):
+    """
+    Add one file's category analysis into the merged category analysis.
+    
+    Args:
+        dest: defaultdict of merged entries for the category, updated in place
+        src: The same category analysis (e.g. swimlane_analysis) from one file
+        fields: Numeric fields to sum for each category value
+        with_tasks: Also collect each category value's 'tasks' list (into
+                    'tasks_parts', see update_analysis_data)
+    """
+    for name, info in src.items():
+        entry = dest[name]
+        for field in fields:
+            entry[field] += info.get(field, 0)
+        if with_tasks:
+            entry['tasks_parts'].append(info.get('tasks', []))
+
+
+def _compute_summary(tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Summary totals for a list of tasks.
+    
+    The parser fills these fields on every task (defaults included), so plain
+    item lookups mapped at C level are safe here.
+    
+    Args:
+        tasks: Task dictionaries
+        
+    Returns:
+        Summary dictionary with task count, totals and currencies
+    """
+    return {
+        'total_tasks': len(tasks),
+        'total_cost': sum(map(itemgetter('total_cost'), tasks)),
+        'total_time_minutes': sum(map(itemgetter('time_minutes'), tasks)),
+        'total_time_hours': sum(map(itemgetter('time_hours'), tasks)),
+        # De-duplicated in first-seen order
+        'currencies': list(dict.fromkeys(filter(None, map(itemgetter('currency'), tasks))))
+    }
+
+
 def update_analysis_data(uploaded_files: List, all_analysis_data: List[Dict[str, Any]]):
     """
     Update session state with uploaded files and analysis data.
@@ -285,27 +374,22 @@ def update_analysis_data(uploaded_files: List, all_analysis_data: List[Dict[str,
         uploaded_files: List of uploaded file objects
         all_analysis_data: List of analysis data dictionaries
     """
-    st.session_state.uploaded_files = uploaded_files
+    # Keep only the file names and sizes: holding the UploadedFile objects would
+    # pin every upload's raw bytes in the session long after they were analyzed
+    st.session_state.uploaded_files = [StoredFile(f.name, f.size) for f in uploaded_files]
+    st.session_state._files_sig = _upload_signature(uploaded_files)
     st.session_state.all_analysis_data = all_analysis_data
     
-    # Combine all tasks from all files
-    combined_tasks = []
-    for data in all_analysis_data:
-        tasks = data.get('tasks', [])
-        if tasks:  # Only extend if tasks exist
-            combined_tasks.extend(tasks)
+    # Combine all tasks from all files in one C-level pass (the tuple default
+    # avoids allocating a list for files without tasks)
+    combined_tasks = list(chain.from_iterable(data.get('tasks', ()) for data in all_analysis_data))
     st.session_state.combined_tasks = combined_tasks
+    st.session_state._has_data = bool(combined_tasks)
     
     # Merge all analysis data for combined view
     if all_analysis_data:
         merged_analysis = {
-            'summary': {
-                'total_tasks': len(combined_tasks),
-                'total_cost': sum(task.get('total_cost', 0) for task in combined_tasks),
-                'total_time_minutes': sum(task.get('time_minutes', 0) for task in combined_tasks),
-                'total_time_hours': sum(task.get('time_hours', 0) for task in combined_tasks),
-                'currencies': list(set(task.get('currency', 'Unknown') for task in combined_tasks if task.get('currency')))
-            },
+            'summary': _compute_summary(combined_tasks),
             'swimlane_analysis': {},
             'owner_analysis': {},
             'status_analysis': {},
@@ -314,74 +398,36 @@ def update_analysis_data(uploaded_files: List, all_analysis_data: List[Dict[str,
             'tasks': combined_tasks
         }
         
-        # Merge swimlane analysis
-        for data in all_analysis_data:
-            for swimlane, info in data.get('swimlane_analysis', {}).items():
-                if swimlane not in merged_analysis['swimlane_analysis']:
-                    merged_analysis['swimlane_analysis'][swimlane] = {
-                        'task_count': 0,
-                        'total_cost': 0,
-                        'total_time_minutes': 0,
-                        'total_time_hours': 0,
-                        'tasks': []
-                    }
-                merged_analysis['swimlane_analysis'][swimlane]['task_count'] += info.get('task_count', 0)
-                merged_analysis['swimlane_analysis'][swimlane]['total_cost'] += info.get('total_cost', 0)
-                merged_analysis['swimlane_analysis'][swimlane]['total_time_minutes'] += info.get('total_time_minutes', 0)
-                merged_analysis['swimlane_analysis'][swimlane]['total_time_hours'] += info.get('total_time_hours', 0)
-                merged_analysis['swimlane_analysis'][swimlane]['tasks'].extend(info.get('tasks', []))
-        
-        # Merge owner analysis
-        for data in all_analysis_data:
-            for owner, info in data.get('owner_analysis', {}).items():
-                if owner not in merged_analysis['owner_analysis']:
-                    merged_analysis['owner_analysis'][owner] = {
-                        'task_count': 0,
-                        'total_cost': 0,
-                        'total_time_minutes': 0
-                    }
-                merged_analysis['owner_analysis'][owner]['task_count'] += info.get('task_count', 0)
-                merged_analysis['owner_analysis'][owner]['total_cost'] += info.get('total_cost', 0)
-                merged_analysis['owner_analysis'][owner]['total_time_minutes'] += info.get('total_time_minutes', 0)
-        
-        # Merge status analysis
-        for data in all_analysis_data:
-            for status, info in data.get('status_analysis', {}).items():
-                if status not in merged_analysis['status_analysis']:
-                    merged_analysis['status_analysis'][status] = {
-                        'task_count': 0,
-                        'total_cost': 0,
-                        'total_time_minutes': 0
-                    }
-                merged_analysis['status_analysis'][status]['task_count'] += info.get('task_count', 0)
-                merged_analysis['status_analysis'][status]['total_cost'] += info.get('total_cost', 0)
-                merged_analysis['status_analysis'][status]['total_time_minutes'] += info.get('total_time_minutes', 0)
-        
-        # Merge priority analysis
-        for data in all_analysis_data:
-            for priority, info in data.get('priority_analysis', {}).items():
-                if priority not in merged_analysis['priority_analysis']:
-                    merged_analysis['priority_analysis'][priority] = {
-                        'task_count': 0,
-                        'total_cost': 0,
-                        'total_time_minutes': 0
-                    }
-                merged_analysis['priority_analysis'][priority]['task_count'] += info.get('task_count', 0)
-                merged_analysis['priority_analysis'][priority]['total_cost'] += info.get('total_cost', 0)
-                merged_analysis['priority_analysis'][priority]['total_time_minutes'] += info.get('total_time_minutes', 0)
-        
-        # Merge doc_status analysis
-        for data in all_analysis_data:
-            for doc_status, info in data.get('doc_status_analysis', {}).items():
-                if doc_status not in merged_analysis['doc_status_analysis']:
-                    merged_analysis['doc_status_analysis'][doc_status] = {
-                        'task_count': 0,
-                        'total_cost': 0,
-                        'total_time_minutes': 0
-                    }
-                merged_analysis['doc_status_analysis'][doc_status]['task_count'] += info.get('task_count', 0)
-                merged_analysis['doc_status_analysis'][doc_status]['total_cost'] += info.get('total_cost', 0)
-                merged_analysis['doc_status_analysis'][doc_status]['total_time_minutes'] += info.get('total_time_minutes', 0)
+        if len(all_analysis_data) == 1:
+            # A single file's category analyses already have the merged shape
+            # (same fields, same task lists), so use them as they are
+            data = all_analysis_data[0]
+            for section in CATEGORY_MERGE_FIELDS:
+                merged_analysis[section] = data.get(section, {})
+        else:
+            # Merge every category analysis in one pass over the files; new category
+            # values get a zeroed entry from the defaultdict factory
+            merged_sections = {
+                section: defaultdict(partial(_new_category_entry, fields, section == 'swimlane_analysis'))
+                for section, fields in CATEGORY_MERGE_FIELDS.items()
+            }
+            for data in all_analysis_data:
+                for section, fields in CATEGORY_MERGE_FIELDS.items():
+                    _merge_category(
+                        merged_sections[section],
+                        data.get(section, {}),
+                        fields,
+                        with_tasks=(section == 'swimlane_analysis')
+                    )
+            
+            # Flatten each swimlane's per-file task lists in one go instead of
+            # growing the list file by file
+            for entry in merged_sections['swimlane_analysis'].values():
+                entry['tasks'] = list(chain.from_iterable(entry.pop('tasks_parts')))
+            
+            # Store plain dicts so later lookups of unknown keys don't create entries
+            for section, merged in merged_sections.items():
+                merged_analysis[section] = dict(merged)
         
         st.session_state.analysis_data = merged_analysis
     else:
@@ -394,6 +440,13 @@ def get_combined_tasks() -> List[Dict[str, Any]]:
     return st.session_state.combined_tasks
 
 
+def get_combined_task_count() -> int:
+    """Get the number of combined tasks without handing out the task list."""
+    init_session_state()
+    tasks = st.session_state.combined_tasks
+    return len(tasks) if tasks is not None else 0
+
+
 def get_analysis_data() -> Dict[str, Any]:
     """Get merged analysis data from all uploaded files."""
     init_session_state()
@@ -404,15 +457,17 @@ def get_analysis_data() -> Dict[str, Any]:
 
 def has_data() -> bool:
     """Check if there is any analysis data available."""
-    init_session_state()
-    tasks = st.session_state.combined_tasks
-    return tasks is not None and len(tasks) > 0
+    # Flag kept in step with combined_tasks by update_analysis_data and the
+    # clear-files handler; a missing key means nothing was uploaded yet
+    return st.session_state.get('_has_data', False)
 
 
 def display_summary_metrics(combined_tasks: List[Dict[str, Any]]):
     """Display summary metrics for the analysis."""
-    total_cost = sum(task.get('total_cost', 0) for task in combined_tasks)
-    total_time = sum(task.get('time_minutes', 0) for task in combined_tasks)
+    # Every parsed task carries these fields, so map plain item lookups
+    total_cost = sum(map(itemgetter('total_cost'), combined_tasks))
+    total_time = sum(map(itemgetter('time_minutes'), combined_tasks))
+    currencies = dict.fromkeys(filter(None, map(itemgetter('currency'), combined_tasks)))
     total_tasks = len(combined_tasks)
     
     col1, col2, col3, col4 = st.columns(4)
@@ -427,7 +482,6 @@ def display_summary_metrics(combined_tasks: List[Dict[str, Any]]):
         st.metric("Total Time", f"{total_time/60:.1f} hours")
     
     with col4:
-        currencies = set(task.get('currency', 'Unknown') for task in combined_tasks if task.get('currency'))
         st.metric("Currencies", ", ".join(currencies) if currencies else "Unknown")
 
 
@@ -436,6 +490,31 @@ def inject_iconify_cdn():
     pass  # Emoji icons don't need CDN injection
 
 
+# Map HeroIcons to emoji (commonly used ones), read-only and built once at import
+_ICON_MAP = MappingProxyType({
+    'heroicons:chart-bar-square': '📊',
+    'heroicons:clipboard-document-list': '📋',
+    'heroicons:building-office-2': '🏭',
+    'heroicons:user-group': '👥',
+    'heroicons:chart-bar': '📊',
+    'heroicons:book-open': '📚',
+    'heroicons:wrench-screwdriver': '🔧',
+    'heroicons:sparkles': '💡',
+    'heroicons:exclamation-triangle': '⚠️',
+    'heroicons:question-mark-circle': '❓',
+    'heroicons:check-circle': '✅',
+    'heroicons:arrow-down-tray': '💾',
+    'heroicons:information-circle': '❓',
+    'heroicons:folder-open': '📁',
+    'heroicons:document-text': '📄',
+    'heroicons:arrow-up-tray': '👆',
+    'heroicons:trash': '🗑️',
+    'heroicons:exclamation-circle': '❌',
+    'heroicons:map': '🧭',
+    'heroicons:check-badge': '✅',
+})
+
+
 def render_icon(icon_name: str, size: int = 20, color: str = INOCTA_COLORS['slate']) -> str:
     """
     Convert HeroIcon name to emoji (Streamlit-compatible).
@@ -453,31 +532,7 @@ def render_icon(icon_name: str, size: int = 20, color: str = INOCTA_COLORS['slat
     if not icon_name.startswith('heroicons:'):
         return icon_name
     
-    # Map HeroIcons to emoji (commonly used ones)
-    icon_map = {
-        'heroicons:chart-bar-square': '📊',
-        'heroicons:clipboard-document-list': '📋',
-        'heroicons:building-office-2': '🏭',
-        'heroicons:user-group': '👥',
-        'heroicons:chart-bar': '📊',
-        'heroicons:book-open': '📚',
-        'heroicons:wrench-screwdriver': '🔧',
-        'heroicons:sparkles': '💡',
-        'heroicons:exclamation-triangle': '⚠️',
-        'heroicons:question-mark-circle': '❓',
-        'heroicons:check-circle': '✅',
-        'heroicons:arrow-down-tray': '💾',
-        'heroicons:information-circle': '❓',
-        'heroicons:folder-open': '📁',
-        'heroicons:document-text': '📄',
-        'heroicons:arrow-up-tray': '👆',
-        'heroicons:trash': '🗑️',
-        'heroicons:exclamation-circle': '❌',
-        'heroicons:map': '🧭',
-        'heroicons:check-badge': '✅',
-    }
-    
-    return icon_map.get(icon_name, '📋')  # Default emoji if not found
+    return _ICON_MAP.get(icon_name, '📋')  # Default emoji if not found
 
 
 def render_page_header(page_title: str = None, icon_name: str = "heroicons:chart-bar-square"):
@@ -496,22 +551,11 @@ def render_page_header(page_title: str = None, icon_name: str = "heroicons:chart
     # Use app name if no title provided
     title = page_title or APP_NAME
     
-    # Render header with icon and version
-    icon_html = render_icon(icon_name, size=32, color=INOCTA_COLORS['deep_teal'])
+    # Render header with icon and version (same lookup as render_icon, whose
+    # size/color arguments are ignored anyway)
+    icon_html = _ICON_MAP.get(icon_name, '📋') if icon_name.startswith('heroicons:') else icon_name
     
-    st.markdown(f"""
-    <div style="margin-bottom: 2rem; padding-bottom: 1rem; border-bottom: 2px solid {INOCTA_COLORS['light_teal']};">
-        <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 8px;">
-            <span style="font-size: 32px;">{icon_html}</span>
-            <h1 style="margin: 0; color: {INOCTA_COLORS['deep_teal']}; font-family: 'Poppins', sans-serif; font-weight: 600; font-size: 2rem;">
-                {title}
-            </h1>
-        </div>
-        <p style="margin: 0; color: {INOCTA_COLORS['slate']}; font-family: 'Roboto', sans-serif; font-size: 0.9rem;">
-            Version {APP_VERSION}
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_TEMPLATE % {'icon': icon_html, 'title': title}, unsafe_allow_html=True)
 
 
 def render_sidebar_header():
@@ -521,7 +565,6 @@ def render_sidebar_header():
     
     # Footer section at bottom of sidebar
     # Note: Streamlit's navigation menu already provides spacing, so we use minimal spacing
-    st.sidebar.markdown("")  # Small spacing instead of separator
-    st.sidebar.markdown(f"**📊 {APP_NAME}**")
-    st.sidebar.markdown(f"*Version: {APP_VERSION}*")
+    # One markdown element: a spacer line, then the app name and version
+    st.sidebar.markdown(SIDEBAR_FOOTER_MD)
 